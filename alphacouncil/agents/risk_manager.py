@@ -5,6 +5,7 @@ from alphacouncil.tools.execution_tools import (
     check_trade_risk,
     get_portfolio_summary,
     get_current_price,
+    market_feed,
 )
 from alphacouncil.execution.limits import compute_position_headroom
 from alphacouncil.execution.risk_rules import DEFAULT_LIMITS
@@ -51,6 +52,13 @@ def _resolve_live_price(ticker: str, fallback: float = 100.0) -> float:
         return fallback
 
 
+def _resolve_live_prices(tickers) -> dict:
+    """Batch form of _resolve_live_price: one snapshot read for every ticker, None where unquoted."""
+    tickers = list(tickers)
+    prices = market_feed.get_prices(tickers)
+    return {t: None if math.isnan(p) else float(p) for t, p in zip(tickers, prices)}
+
+
 def _calculate_daily_pnl(state, default_price: float = 100.0) -> float:
     """
     Calculate today's realized P&L from trade history.
@@ -163,8 +171,10 @@ def risk_manager_agent(state):
     portfolio = PortfolioService()
     state_data = portfolio.get_state()
     daily_pnl = _calculate_daily_pnl(state_data, live_price)
+    # Marks for the whole book, read once and shared with the headroom sizing below
+    book_marks = _resolve_live_prices(state_data.holdings)
     total_equity = state_data.cash_balance + sum(
-        pos.quantity * _resolve_live_price(t) 
+        pos.quantity * (book_marks[t] or 100.0)
         for t, pos in state_data.holdings.items()
     )
     if total_equity > 0 and daily_pnl / total_equity < -DEFAULT_LIMITS.MAX_DAILY_DRAWDOWN:
@@ -217,7 +227,9 @@ def risk_manager_agent(state):
 
     target_qty = max(requested_qty, 0)
 
-    limits = compute_position_headroom(ticker, live_price)
+    limits = compute_position_headroom(
+        ticker, live_price, state=state_data, price_lookup=book_marks.get
+    )
 
     # 2b. HARD STOP: Reject if exceeds limits (with max_qty suggestion)
     if target_qty > limits["max_qty"]:
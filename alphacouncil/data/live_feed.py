@@ -1,9 +1,10 @@
 import os
 import math
+import numpy as np
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from volsense_inference.sector_mapping import get_sector_map
 CACHE_FILE = "data/market_cache.csv"
 class LiveMarketFeed:
@@ -61,7 +62,7 @@ class LiveMarketFeed:
             # Multi-ticker download returns MultiIndex columns: ('Close', 'NVDA'), ('Close', 'AAPL'), etc.
             if isinstance(df.columns, pd.MultiIndex):
                 # Get tickers from the column level
-                available_tickers = df.columns.get_level_values(1).unique().tolist()
+                available_tickers = set(df.columns.get_level_values(1))
                 
                 for ticker in self.universe:
                     try:
@@ -109,6 +110,20 @@ class LiveMarketFeed:
             print(f"⚠️ Market Fetch Failed: {e}")
             import traceback
             traceback.print_exc()
+    def get_prices(self, tickers: List[str]) -> np.ndarray:
+        """Batch lookup aligned with `tickers`; NaN where get_price would return None."""
+        if not tickers:
+            # An empty book must not trigger a universe-wide download on a cold feed
+            return np.empty(0, dtype=np.float64)
+        if not self._price_cache:
+            self.refresh_snapshot()
+        cache = self._price_cache
+        prices = np.fromiter(
+            (cache.get(t.upper(), np.nan) for t in tickers), dtype=np.float64, count=len(tickers)
+        )
+        prices[~(prices > 0)] = np.nan  # also maps NaN itself, matching get_price
+        return prices
+
     def get_price(self, ticker: str) -> Optional[float]:
         ticker = ticker.upper()
         if not self._price_cache:
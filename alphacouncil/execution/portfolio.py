@@ -1,5 +1,6 @@
 import os
 import json
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
@@ -34,13 +35,21 @@ class PortfolioService:
     def __init__(self, data_dir: str = "data", filename: str = "paper_portfolio.json"):
         self.file_path = os.path.join(os.getcwd(), data_dir, filename)
         self._ensure_dir_exists(data_dir)
+        self._lock = threading.RLock()
         self.state = self._load_or_create()
+        self._loaded_mtime = self._ledger_mtime()
         
         # --- FIX: Force save immediately if file is missing ---
         if not os.path.exists(self.file_path):
             print(f"🆕 Creating new portfolio ledger at {self.file_path}")
             self.save()
 
+    def _ledger_mtime(self) -> int:
+        try:
+            return os.stat(self.file_path).st_mtime_ns
+        except OSError:
+            return 0
+
     def _ensure_dir_exists(self, data_dir):
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
@@ -68,11 +77,24 @@ class PortfolioService:
         self.state.last_updated = datetime.now().isoformat()
         with open(self.file_path, "w") as f:
             f.write(self.state.model_dump_json(indent=2))
+        self._loaded_mtime = self._ledger_mtime()
 
     # --- READ METHODS ---
     def get_state(self) -> PortfolioState:
         return self.state
 
+    def ledger_version(self) -> int:
+        """Changes whenever any PortfolioService writes the ledger file (its mtime in ns)."""
+        return self._ledger_mtime()
+
+    def reload_if_changed(self) -> PortfolioState:
+        """Re-read the ledger only if another PortfolioService wrote it since our last load/save."""
+        with self._lock:
+            if self._ledger_mtime() != self._loaded_mtime:
+                self.state = self._load_or_create()
+                self._loaded_mtime = self._ledger_mtime()
+            return self.state
+
     def get_cash(self) -> float:
         return self.state.cash_balance
 
@@ -84,7 +106,14 @@ class PortfolioService:
         """
         Executes a trade ONLY if valid (Risk Manager should check limits before calling this).
         Updates Cash, Holdings (Avg Cost), and History.
+        Serialised on this service and re-reads the ledger first, so a shared
+        instance never trades against state another writer has moved on from.
         """
+        with self._lock:
+            self.reload_if_changed()
+            return self._apply_trade(ticker, action, qty, price)
+
+    def _apply_trade(self, ticker: str, action: str, qty: int, price: float) -> str:
         ticker = ticker.upper()
         action = action.upper()
         total_cost = qty * price
@@ -1,8 +1,11 @@
 import os
 import json
+import threading
 from datetime import date
 from typing import Optional, Dict, Any
 
+from alphacouncil.utils import fast_json
+
 # 1. Create a 'logs' directory to keep things tidy
 ROOT_DIR = os.getcwd()
 LOG_DIR = os.path.join(ROOT_DIR, "logs")
@@ -18,6 +21,12 @@ class DailyCacheManager:
         
         self._ensure_file_exists()
         self._cache = self._load_cache()
+        # Bumped whenever _cache is replaced; lets readers memoize derived views
+        self._version = 0
+        # Serializes disk writes; background saves may overlap with foreground ones
+        self._write_lock = threading.Lock()
+        # (version, ticker) -> (payload, encoded JSON); emptied whenever the version moves
+        self._encoded: Dict[tuple, tuple] = {}
 
     def _check_date_change(self) -> bool:
         """Check if the date has changed since initialization and refresh if needed."""
@@ -29,6 +38,8 @@ class DailyCacheManager:
             self.file_path = os.path.join(LOG_DIR, self.filename)
             self._ensure_file_exists()
             self._cache = self._load_cache()
+            self._version += 1
+            self._encoded = {}
             return True
         return False
     
@@ -36,6 +47,11 @@ class DailyCacheManager:
         """Check if cache is from a previous day."""
         return date.today().isoformat() != self._init_date
     
+    def version(self) -> str:
+        """Identity of the current cache contents: changes on every hydration, store or clear."""
+        self._check_date_change()
+        return f"{self._init_date}:{self._version}"
+
     def get_cache_date(self) -> str:
         """Return the date of the current cache."""
         return self._init_date
@@ -51,32 +67,79 @@ class DailyCacheManager:
 
     def _load_cache(self) -> Dict[str, Any]:
         try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
+            with open(self.file_path, "rb") as f:
+                return fast_json.loads(f.read())
         except Exception:
             return {}
 
     def _save_cache(self):
-        try:
-            with open(self.file_path, "w") as f:
-                json.dump(self._cache, f, indent=2)
-        except Exception as e:
-            print(f"[ERROR] Failed to write log: {e}")
+        with self._write_lock:
+            # Snapshot under the lock so a later writer always dumps a later state
+            snapshot = dict(self._cache)
+            tmp_path = f"{self.file_path}.tmp"
+            try:
+                # One compact C-level encode of 500+ payloads with 180-day histories
+                data = fast_json.dumps_bytes(snapshot)
+                # Write aside and rename: a crash mid-write leaves the previous log intact
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.file_path)
+            except Exception as e:
+                print(f"[ERROR] Failed to write log: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def save_async(self) -> threading.Thread:
+        """Flush the cache to disk on a background thread; in-memory reads are unaffected.
+
+        Non-daemon, so interpreter shutdown waits for an in-flight write instead of dropping it.
+        """
+        thread = threading.Thread(target=self._save_cache, name="vol-cache-writer", daemon=False)
+        thread.start()
+        return thread
 
     def get_valid_entry(self, ticker: str) -> Optional[Dict[str, Any]]:
         # Check for date change before returning cached data
         self._check_date_change()
         return self._cache.get(ticker.upper())
 
+    def get_encoded_entry(self, ticker: str) -> Optional[str]:
+        """Return the cached entry as a JSON string, encoding each payload at most once."""
+        key = (self.version(), ticker.upper())
+        payload = self._cache.get(key[1])
+        if not payload:
+            return None
+        hit = self._encoded.get(key)
+        if hit is not None and hit[0] is payload:
+            return hit[1]
+        encoded = fast_json.dumps(payload)
+        self._encoded[key] = (payload, encoded)
+        return encoded
+
+    def publish_entries(self, entries: Dict[str, Any]):
+        """
+        Copy-on-write update: build the new dict aside and swap the reference once.
+        Readers hold no lock and never see a dict that changes while they iterate it.
+        """
+        self._check_date_change()
+        new_cache = dict(self._cache)
+        new_cache.update(entries)
+        self._cache = new_cache
+        self._version += 1
+        self._encoded = {}
+
     def store_entry(self, ticker: str, data: Dict[str, Any]):
         # Check for date change before storing
-        self._check_date_change()
-        self._cache[ticker.upper()] = data
+        self.publish_entries({ticker.upper(): data})
         self._save_cache()
     
     def clear(self):
         """Clear the in-memory cache (forces re-hydration on next access)."""
         self._cache = {}
+        self._version += 1
+        self._encoded = {}
         self._save_cache()
 
     def _today_str(self):
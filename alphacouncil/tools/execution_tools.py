@@ -1,3 +1,5 @@
+import math
+
 from alphacouncil.utils.langchain_stub import tool
 from alphacouncil.execution.portfolio import PortfolioService
 from alphacouncil.execution.risk_rules import DEFAULT_LIMITS
@@ -25,9 +27,11 @@ def get_portfolio_summary() -> str:
     if not state.holdings:
         lines.append("  (Empty)")
     else:
-        for ticker, pos in state.holdings.items():
-            # USE REAL PRICE HERE
-            live_price = market_feed.get_price(ticker) or pos.avg_price
+        # USE REAL PRICES HERE: one snapshot read for the whole book
+        live_prices = market_feed.get_prices(list(state.holdings))
+        for (ticker, pos), live_price in zip(state.holdings.items(), live_prices):
+            if math.isnan(live_price):
+                live_price = pos.avg_price
             val = pos.quantity * live_price
             
             # Calculate Unrealized P&L (Preserved from your original file)
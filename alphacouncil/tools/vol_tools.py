@@ -1,13 +1,16 @@
 import os
+import numpy as np
 import pandas as pd
 import json
 import builtins
+import threading
 from collections import defaultdict
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 from alphacouncil.persistence import get_daily_cache
+from alphacouncil.utils import fast_json
 from alphacouncil.utils.langchain_stub import tool
 
 # --- MONKEY PATCH ---
@@ -23,9 +26,18 @@ from volsense_inference.signal_engine import SignalEngine
 from volsense_inference.sector_mapping import get_sector_map, get_ticker_type_map
 
 
+# Broad reference set run alongside a single ticker on a cold-cache miss, so its
+# cross-sectional scores have some peers before the full hydration lands.
+REFERENCE_UNIVERSE = ["SPY", "QQQ", "IWM", "TLT", "GLD", "XLK"]
+# Same-sector tickers added to that run so sector z-scores/ranks have a real peer group
+MAX_SECTOR_PEERS = 12
+
+
 class VolSenseService:
     _instance = None
     _forecast_engine: Optional[Forecast] = None
+    # Tickers per model forward pass; keeps peak memory bounded on the 507 universe
+    inference_batch_size: int = 64
 
     @classmethod
     def get_instance(cls):
@@ -37,116 +49,185 @@ class VolSenseService:
         self.model_version = "volnetx"
         # UPGRADE: Target the full 507-ticker universe
         self.universe_map = get_sector_map("v507") 
+        self._type_map = get_ticker_type_map(self.model_version)
         self.checkpoints_dir = os.path.join(
             os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
             "modules", "VolSense", "models"
         )
+        # Anchored next to the checkpoints so every entry point shares the daily fetch
+        self.cache_dir = os.path.join(os.path.dirname(self.checkpoints_dir), ".volsense_cache")
+        # Forecast.run mutates df_recent/predictions, so engine use is serialized
+        self._engine_lock = threading.Lock()
+        # Separate from _engine_lock: callers may load the model without running it
+        self._load_lock = threading.Lock()
+        self._hydration_thread: Optional[threading.Thread] = None
+        self._warmup_thread: Optional[threading.Thread] = None
+        # Small-universe results served until the full hydration is logged: ticker -> (cache date, payload)
+        self._provisional: dict[str, tuple[str, dict]] = {}
         
     def _ensure_loaded(self):
-        if self._forecast_engine is None:
-            print(f"🔄 VolSenseService: Loading model {self.model_version}...")
-            self._forecast_engine = Forecast(
-                model_version=self.model_version,
-                checkpoints_dir=self.checkpoints_dir,
-                start="2015-01-01"
-            )
+        if self._forecast_engine is not None:
+            return
+        with self._load_lock:
+            # Re-check: a concurrent session may have finished the load while we waited
+            if self._forecast_engine is None:
+                print(f"🔄 VolSenseService: Loading model {self.model_version}...")
+                self._forecast_engine = Forecast(
+                    model_version=self.model_version,
+                    checkpoints_dir=self.checkpoints_dir,
+                    start="2015-01-01",
+                    cache_dir=self.cache_dir,
+                )
+
+    def warm_up(self):
+        """
+        Loads the forecast model on a daemon thread so the first hydration finds it ready.
+        Safe to call repeatedly; _ensure_loaded coalesces with any concurrent load.
+        """
+        if self._forecast_engine is not None:
+            return
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            return
+        self._warmup_thread = threading.Thread(
+            target=self._warm_up_worker, name="volsense-warmup", daemon=True
+        )
+        self._warmup_thread.start()
+
+    def _warm_up_worker(self):
+        try:
+            self._ensure_loaded()
+        except Exception as e:
+            # The request path retries the load and surfaces the error there
+            print(f"⚠️ VolSenseService: Model warm-up failed: {e}")
 
     def hydrate_market(self):
         """
         Runs batch inference on the full v507 universe and logs to today's file.
         """
-        self._ensure_loaded()
         cache = get_daily_cache()
         tickers = list(self.universe_map.keys())
         
         print(f"🌊 HYDRATING MARKET: Batch inference on {len(tickers)} tickers (volnetx)...")
         
-        # 1. BATCH PREDICTION (One big network call)
-        preds = self._forecast_engine.run(tickers=tickers)
+        payloads = self._build_payloads(tickers)
+        cache.publish_entries(payloads)
+        self._provisional.clear()
+            
+        # One write to disk, off the caller's path: the payloads are already served from memory
+        cache.save_async()
+        print(f"✅ Market Hydration Complete. Logged {len(payloads)} tickers.")
+
+    def _build_payloads(self, tickers: list[str]) -> dict[str, dict]:
+        """
+        Runs inference + signals for `tickers` and returns ticker -> payload.
+        """
+        # 1. BATCH PREDICTION (one feature build, tiled forward passes)
+        with self._engine_lock:
+            self._ensure_loaded()
+            preds = self._forecast_engine.run(
+                tickers=tickers, batch_size=self.inference_batch_size
+            )
+            full_hist = self._forecast_engine.df_recent
         
-        # 2. GLOBAL SIGNALS (Z-scores now relative to 500+ peers)
+        # 2. CROSS-SECTIONAL SIGNALS (Z-scores relative to the tickers passed in)
         sig = SignalEngine(model_version=self.model_version)
         sig.set_data(preds)
         sig.compute_signals(enrich_with_sectors=True)
+        # Payload values are rounded to <= 4 decimals, so float32 loses nothing; signal_strength
+        # is published unrounded and stays float64
+        float_cols = sig.signals.select_dtypes(include="float64").columns.drop(
+            "signal_strength", errors="ignore"
+        )
+        sig.signals[float_cols] = sig.signals[float_cols].astype("float32")
         
-        type_map = get_ticker_type_map(self.model_version)
-        full_hist = self._forecast_engine.df_recent
+        type_map = self._type_map
+        rows_by_ticker = self._signal_table(sig.signals, preds).to_dict("index")
+
+        # Sort history once and keep each ticker's last 180 rows; every ticker is then a
+        # contiguous [start, end) block of the columnar lists below
+        # Only these three columns are serialized; project before sorting so the
+        # feature columns are never copied, and shrink what remains
+        full_hist = full_hist[["ticker", "date", "realized_vol"]].astype(
+            {"ticker": "category", "realized_vol": "float32"}
+        )
+        full_hist = full_hist.sort_values(["ticker", "date"])
+        full_hist = full_hist[
+            full_hist.groupby("ticker", observed=True).cumcount(ascending=False) < 180
+        ]
+        hist_tickers = full_hist["ticker"].to_numpy()
+        hist_starts = np.searchsorted(hist_tickers, tickers, side="left")
+        hist_ends = np.searchsorted(hist_tickers, tickers, side="right")
+        # Whole-column formatting: one strftime and one NaN/round pass for all tickers
+        hist_dates = full_hist["date"].dt.strftime("%Y-%m-%d").tolist()
+        hist_vols = [
+            None if np.isnan(v) else round(v, 4)
+            for v in full_hist["realized_vol"].to_numpy(dtype="float64").tolist()
+        ]
+
+        # One hash index over predictions instead of a column scan per lookup
+        pred_cols = [f"pred_vol_{h}" for h in (1, 5, 10) if f"pred_vol_{h}" in preds.columns]
+        pred_frame = preds.drop_duplicates("ticker").set_index("ticker")[pred_cols]
+        # Forecast levels for every ticker from one float matrix: NaN -> None, keyed by horizon
+        pred_keys = [col.rsplit("_", 1)[1] for col in pred_cols]
+        levels_by_ticker = {
+            t: {k: None if np.isnan(v) else v for k, v in zip(pred_keys, vals)}
+            for t, vals in zip(pred_frame.index, pred_frame.to_numpy(dtype="float64").tolist())
+        }
         
-        print("💾 Serializing to daily log...")
+        print("💾 Serializing payloads...")
         
-        count = 0
-        for ticker in tickers:
+        payloads = {}
+        for i, ticker in enumerate(tickers):
             # Data Quality Check
-            row_slice = sig.signals[sig.signals["ticker"] == ticker]
-            if row_slice.empty:
+            r = rows_by_ticker.get(ticker)
+            if r is None:
                 continue
             
-            # Get z-scores for each horizon
-            z_scores_by_horizon = {}
-            for h in [1, 5, 10]:
-                h_row = row_slice[row_slice["horizon"] == h]
-                if not h_row.empty:
-                    z_scores_by_horizon[h] = round(float(h_row.iloc[0].get("vol_zscore", 0)), 2)
-                else:
-                    z_scores_by_horizon[h] = 0.0
-            
-            # Use horizon=5 as the primary row for most metrics (most common trading horizon)
-            row = row_slice[row_slice["horizon"] == 5].iloc[0] if not row_slice[row_slice["horizon"] == 5].empty else row_slice.iloc[0]
-            
-            # Use horizon=1 row for vol_spread and today_vol (only computed for h=1)
-            row_h1 = row_slice[row_slice["horizon"] == 1].iloc[0] if not row_slice[row_slice["horizon"] == 1].empty else row
-            
             # Serialize History (180 days)
-            t_hist = full_hist[full_hist["ticker"] == ticker].sort_values("date").tail(180)
+            start, end = hist_starts[i], hist_ends[i]
             history_json = [
-                {"date": r["date"].strftime("%Y-%m-%d"), 
-                 "realized_vol": float(r["realized_vol"]) if pd.notna(r["realized_vol"]) else None}
-                for _, r in t_hist.iterrows()
+                {"date": d, "realized_vol": v}
+                for d, v in zip(hist_dates[start:end], hist_vols[start:end])
             ]
             
             # Serialize Forecasts
-            forecast_levels = {}
-            for h in [1, 5, 10]:
-                col = f"pred_vol_{h}"
-                if col in preds.columns:
-                    val = preds.loc[preds["ticker"] == ticker, col].values[0]
-                    forecast_levels[str(h)] = float(val) if pd.notna(val) else None
+            forecast_levels = levels_by_ticker.get(ticker) or dict.fromkeys(pred_keys)
 
             payload = {
                 "ticker": ticker,
                 "type": type_map.get(ticker, "Equity"),
-                "sector": str(row.get("sector", "Unknown")),
+                "sector": r["sector"],
                 
                 # --- NEW: Explicit Signal Block ---
                 "signal": {
-                    "position": str(row.get("position", "NEUTRAL")),
-                    "action": str(row.get("action", "Wait")),
-                    "strength": float(row.get("signal_strength", 0.0))
+                    "position": r["position"],
+                    "action": r["action"],
+                    "strength": r["strength"]
                 },
                 # ----------------------------------
 
                 "metrics": {
-                    "current_vol": round(float(row_h1.get("today_vol", 0)), 4),
+                    "current_vol": r["current_vol"],
                     # ... (keep existing 1d/5d/10d forecasts) ...
-                    "forecast_1d": round(float(row.get("forecast_vol_1", preds.loc[preds["ticker"] == ticker, "pred_vol_1"].values[0] if "pred_vol_1" in preds.columns else 0)), 4),
-                    "forecast_5d": round(float(row.get("forecast_vol", 0)), 4),
-                    "forecast_10d": round(float(row.get("forecast_vol_10", preds.loc[preds["ticker"] == ticker, "pred_vol_10"].values[0] if "pred_vol_10" in preds.columns else 0)), 4),
-                    "vol_spread_pct": round(float(row_h1.get("vol_spread", 0)), 4),
-                    "z_score": z_scores_by_horizon.get(5, 0.0),  # Default to 5d for backward compat
-                    "z_score_1d": z_scores_by_horizon.get(1, 0.0),
-                    "z_score_5d": z_scores_by_horizon.get(5, 0.0),
-                    "z_score_10d": z_scores_by_horizon.get(10, 0.0),
-                    "term_spread_10v5": round(float(row.get("term_spread_10v5", 0)), 4),
+                    "forecast_1d": r["forecast_1d"],
+                    "forecast_5d": r["forecast_5d"],
+                    "forecast_10d": r["forecast_10d"],
+                    "vol_spread_pct": r["vol_spread_pct"],
+                    "z_score": r["z_score_5d"],  # Default to 5d for backward compat
+                    "z_score_1d": r["z_score_1d"],
+                    "z_score_5d": r["z_score_5d"],
+                    "z_score_10d": r["z_score_10d"],
+                    "term_spread_10v5": r["term_spread_10v5"],
                     
                     # --- NEW: Add Momentum for Context ---
-                    "momentum_5d": round(float(row.get("momentum_5d", 0)), 4),
-                    "momentum_20d": round(float(row.get("momentum_20d", 0)), 4),
+                    "momentum_5d": r["momentum_5d"],
+                    "momentum_20d": r["momentum_20d"],
                 },
                 "context": {
-                    "regime": str(row.get("regime_flag", "Normal")),
-                    "sector_z_score": round(float(row.get("sector_z", 0)), 2),
-                    "rank_in_sector": round(float(row.get("rank_sector", 0.5)), 2),
-                    "heuristic_signal": str(row.get("position", "neutral"))
+                    "regime": r["regime"],
+                    "sector_z_score": r["sector_z_score"],
+                    "rank_in_sector": r["rank_in_sector"],
+                    "heuristic_signal": r["heuristic_signal"]
                 },
                 "plot_data": {
                     "history": history_json,
@@ -154,13 +235,151 @@ class VolSenseService:
                 }
             }
             
-            # Update memory cache
-            cache._cache[ticker] = payload
-            count += 1
-            
-        # One atomic write to disk
-        cache._save_cache()
-        print(f"✅ Market Hydration Complete. Logged {count} tickers.")
+            payloads[ticker] = payload
+
+        return payloads
+
+    @staticmethod
+    def _signal_table(signals: pd.DataFrame, preds: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds every scalar payload field for all tickers in one vectorized pass.
+        Index is ticker; only tickers with at least one signal row appear.
+        """
+        # Primary row per ticker: horizon 5 (most common trading horizon), else its first row
+        primary = (
+            signals.assign(_not_h5=signals["horizon"] != 5)
+            .sort_values(["ticker", "_not_h5"], kind="stable")
+            .drop_duplicates("ticker")
+            .set_index("ticker")
+        )
+        idx = primary.index
+
+        def num(frame, col, default):
+            if col in frame.columns:
+                return frame[col].astype("float64")
+            if isinstance(default, pd.Series):
+                return default
+            return pd.Series(default, index=idx, dtype="float64")
+
+        def text(col, default):
+            if col in primary.columns:
+                return primary[col].astype(str)
+            return pd.Series(default, index=idx, dtype=object)
+
+        # vol_spread / today_vol are only computed for h=1; fall back to the primary row
+        h1_rows = signals[signals["horizon"] == 1].drop_duplicates("ticker").set_index("ticker")
+        has_h1 = idx.isin(h1_rows.index)
+        h1 = h1_rows.reindex(idx)
+
+        def from_h1(col):
+            return num(h1, col, 0.0).where(has_h1, num(primary, col, 0.0))
+
+        # Prediction fallbacks: missing ticker -> 0, present-but-NaN stays NaN
+        in_preds = idx.isin(preds["ticker"])
+        pred_aligned = preds.drop_duplicates("ticker").set_index("ticker").reindex(idx)
+
+        def pred(col):
+            if col not in pred_aligned.columns:
+                return pd.Series(0.0, index=idx)
+            return pred_aligned[col].astype("float64").where(in_preds, 0.0)
+
+        # z-score per horizon from each ticker's first row at that horizon; absent -> 0.0,
+        # present-but-NaN stays NaN (it must not pass the |z| filters as a neutral 0)
+        if "vol_zscore" in signals.columns:
+            first_rows = signals.drop_duplicates(["ticker", "horizon"])
+            z = (
+                first_rows.pivot(index="ticker", columns="horizon", values="vol_zscore")
+                .reindex(index=idx, columns=[1, 5, 10])
+                .astype("float64")
+            )
+            present = (
+                first_rows.assign(_present=True)
+                .pivot(index="ticker", columns="horizon", values="_present")
+                .reindex(index=idx, columns=[1, 5, 10])
+                .notna()
+            )
+            z = z.where(present, 0.0).round(2)
+        else:
+            z = pd.DataFrame(0.0, index=idx, columns=[1, 5, 10])
+
+        table = pd.DataFrame(
+            {
+                "current_vol": from_h1("today_vol"),
+                "forecast_1d": num(primary, "forecast_vol_1", pred("pred_vol_1")),
+                "forecast_5d": num(primary, "forecast_vol", 0.0),
+                "forecast_10d": num(primary, "forecast_vol_10", pred("pred_vol_10")),
+                "vol_spread_pct": from_h1("vol_spread"),
+                "term_spread_10v5": num(primary, "term_spread_10v5", 0.0),
+                "momentum_5d": num(primary, "momentum_5d", 0.0),
+                "momentum_20d": num(primary, "momentum_20d", 0.0),
+            },
+            index=idx,
+        ).round(4)
+        table["z_score_1d"] = z[1]
+        table["z_score_5d"] = z[5]
+        table["z_score_10d"] = z[10]
+        table["sector_z_score"] = num(primary, "sector_z", 0.0).round(2)
+        table["rank_in_sector"] = num(primary, "rank_sector", 0.5).round(2)
+        table["strength"] = num(primary, "signal_strength", 0.0)
+        table["sector"] = text("sector", "Unknown")
+        table["position"] = text("position", "NEUTRAL")
+        table["action"] = text("action", "Wait")
+        table["regime"] = text("regime_flag", "Normal")
+        table["heuristic_signal"] = text("position", "neutral")
+        return table
+
+    def _sector_peers(self, ticker: str) -> list[str]:
+        sector = self.universe_map.get(ticker)
+        peers = [t for t, s in self.universe_map.items() if s == sector and t != ticker]
+        return peers[:MAX_SECTOR_PEERS]
+
+    def _run_small_universe(self, ticker: str) -> Optional[dict]:
+        """
+        Fast path for a cold cache: infer `ticker` against its sector peers plus
+        REFERENCE_UNIVERSE. Z-scores and ranks are relative to this small peer set,
+        so the payload is flagged provisional and kept out of the daily log.
+        """
+        tickers = [ticker] + self._sector_peers(ticker)
+        tickers += [t for t in REFERENCE_UNIVERSE if t not in tickers]
+        payload = self._build_payloads(tickers).get(ticker)
+        if payload:
+            payload["provisional"] = True
+            self._provisional[ticker] = (self._cache_day(), payload)
+        return payload
+
+    @staticmethod
+    def _cache_day() -> str:
+        cache = get_daily_cache()
+        cache.version()  # rolls the daily cache over if the date has changed
+        return cache.get_cache_date()
+
+    def _get_provisional(self, ticker: str) -> Optional[dict]:
+        """Today's small-universe payload for `ticker`, dropping any left over from a previous day."""
+        entry = self._provisional.get(ticker)
+        if entry is None:
+            return None
+        day, payload = entry
+        if day != self._cache_day():
+            self._provisional.pop(ticker, None)
+            return None
+        return payload
+
+    def _hydrate_in_background(self):
+        if self._hydration_thread is None or not self._hydration_thread.is_alive():
+            self._hydration_thread = threading.Thread(
+                target=self.hydrate_market, name="volsense-hydration", daemon=True
+            )
+            self._hydration_thread.start()
+
+    def ensure_hydrated(self):
+        """
+        Blocks until today's log is populated, reusing an in-flight background hydration.
+        """
+        thread = self._hydration_thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        if not get_daily_cache()._cache:
+            self.hydrate_market()
 
 
     def get_rich_data(self, ticker: str) -> dict:
@@ -171,11 +390,28 @@ class VolSenseService:
         if cached_result:
             return cached_result
 
-        # 2. CACHE MISS -> TRIGGER BATCH HYDRATION
-        # Use the map to check validity before running a 1-minute job
+        # 2. CACHE MISS -> TARGETED COMPUTE, FULL HYDRATION IN BACKGROUND
+        # Use the map to check validity before running any inference
         if ticker in self.universe_map:
-            print(f"🐢 CACHE MISS for {ticker}. Triggering Market Hydration...")
-            self.hydrate_market()
+            provisional = self._get_provisional(ticker)
+            if provisional is not None:
+                # Keep pushing for the full log: a failed background hydration is retried here
+                self._hydrate_in_background()
+                return provisional
+
+            thread = self._hydration_thread
+            if thread is not None and thread.is_alive():
+                # Full run already holds the engine; waiting is no slower than a small run
+                print(f"🐢 CACHE MISS for {ticker}. Waiting on in-flight hydration...")
+                thread.join()
+            else:
+                print(f"🐢 CACHE MISS for {ticker}. Running targeted inference...")
+                payload = self._run_small_universe(ticker)
+                self._hydrate_in_background()
+                if payload:
+                    return payload
+                # Small universe failed (e.g. data gap); fall back to the full run
+                self.ensure_hydrated()
             
             # 3. RE-CHECK
             cached_result = cache.get_valid_entry(ticker)
@@ -187,10 +423,15 @@ class VolSenseService:
 
 
 def _fetch_vol_payload(ticker: str) -> str:
+    # Cache hits skip the dict -> JSON pass, which is the only real work left on a hit
+    encoded = get_daily_cache().get_encoded_entry(ticker)
+    if encoded is not None:
+        return encoded
+
     service = VolSenseService.get_instance()
     try:
         data = service.get_rich_data(ticker.upper())
-        return json.dumps(data)
+        return fast_json.dumps(data)
     except Exception as exc:  # pragma: no cover - defensive path
         return json.dumps({"error": str(exc)})
 
@@ -219,44 +460,59 @@ def get_sector_trends() -> str:
     cache = get_daily_cache()
     if not getattr(cache, "_cache", {}):
         try:
-            VolSenseService.get_instance().hydrate_market()
+            VolSenseService.get_instance().ensure_hydrated()
         except Exception as exc:  # pragma: no cover - defensive path
             return json.dumps({"error": str(exc)})
 
     if not cache._cache:
         return json.dumps({"error": "No volatility cache available for today."})
 
-    sector_stats: dict[str, list[float]] = defaultdict(list)
-    signal_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
+    rows = []
     for payload in cache._cache.values():
-        sector = payload.get("sector", "Unknown")
         signal_block = payload.get("signal", {}) or {}
-        strength = signal_block.get("strength")
-        position = (signal_block.get("position") or "NEUTRAL").upper()
+        rows.append(
+            (
+                payload.get("sector", "Unknown"),
+                (signal_block.get("position") or "NEUTRAL").upper(),
+                signal_block.get("strength"),
+                signal_block.get("strength") is not None,
+            )
+        )
+    df = pd.DataFrame(rows, columns=["sector", "position", "strength", "reported"])
+    df["strength"] = pd.to_numeric(df["strength"], errors="coerce")
+    # Row of each sector's first reported strength: the old loop listed sectors in that order,
+    # and listed them even when no reported strength parsed (at 0.0)
+    df["first_valid"] = np.arange(len(df), dtype=np.float64)
+    df.loc[~df["reported"], "first_valid"] = np.nan
 
-        if strength is not None:
-            try:
-                sector_stats[sector].append(float(strength))
-            except (TypeError, ValueError):
-                pass
+    # dropna=False keeps payloads whose sector is None, as the old loop did
+    agg = df.groupby("sector", sort=False, dropna=False).agg(
+        avg_signal_strength=("strength", "mean"),
+        reported_count=("reported", "sum"),
+        observation_count=("position", "size"),
+        first_valid=("first_valid", "min"),
+    )
+    # Only sectors with at least one reported strength are listed, strongest first; the stable
+    # sort on the rounded value keeps ties in first-seen order
+    agg = agg[agg["reported_count"] > 0].sort_values("first_valid")
+    agg["avg_signal_strength"] = agg["avg_signal_strength"].fillna(0.0).round(4)
+    agg = agg.sort_values("avg_signal_strength", ascending=False, kind="stable")
 
-        signal_counts[sector][position] += 1
+    positions: dict = defaultdict(dict)
+    position_counts = df.groupby(["sector", "position"], sort=False, dropna=False).size()
+    for (sector, pos), n in position_counts.items():
+        positions[None if pd.isna(sector) else sector][pos] = int(n)
 
     summary = []
-    for sector, strengths in sector_stats.items():
-        avg_strength = sum(strengths) / len(strengths) if strengths else 0.0
-        counts = signal_counts.get(sector, {})
+    for sector, stats in agg.iterrows():
+        sector = None if pd.isna(sector) else sector
         summary.append(
             {
                 "sector": sector,
-                "avg_signal_strength": round(avg_strength, 4),
-                "positions": counts,
-                "observation_count": sum(counts.values()),
+                "avg_signal_strength": float(stats.avg_signal_strength),
+                "positions": positions[sector],
+                "observation_count": int(stats.observation_count),
             }
         )
 
-    # Sort sectors by descending signal strength for readability
-    summary.sort(key=lambda item: item["avg_signal_strength"], reverse=True)
-
     return json.dumps({"sectors": summary})
\ No newline at end of file
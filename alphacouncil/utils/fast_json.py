@@ -0,0 +1,31 @@
+"""JSON encode/decode backed by orjson when available, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+_ORJSON_OPTS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Compact UTF-8 JSON. orjson writes NaN as null; the stdlib fallback writes NaN."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON as str, for tool outputs."""
+    return dumps_bytes(obj).decode()
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,12 +1,15 @@
 import streamlit as st
+import numpy as np
 import os
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Internal Imports
-from alphacouncil.execution.portfolio import PortfolioService
-from alphacouncil.tools.vol_tools import VolSenseService
-from alphacouncil.data.live_feed import LiveMarketFeed
+from app._services import (
+    vol_service as get_vol_service,
+    market_feed as get_market_feed,
+    portfolio as get_portfolio,
+)
 
 # BRIDGE: Load secrets into environment variables for LangChain/Gemini
 # This works for both Local (reads secrets.toml) and Cloud (reads Secrets Management)
@@ -25,10 +28,10 @@ st.set_page_config(
 )
 
 # Initialize Services
-portfolio = PortfolioService()
-pf_state = portfolio.get_state()
-vol_service = VolSenseService.get_instance()
-market = LiveMarketFeed.get_instance()
+portfolio = get_portfolio()
+pf_state = portfolio.reload_if_changed()
+vol_service = get_vol_service()
+market = get_market_feed()
 
 # --- HEADER ---
 st.title("☕ Morning Briefing")
@@ -39,10 +42,12 @@ st.subheader("🏦 Portfolio Snapshot")
 c1, c2, c3 = st.columns(3)
 
 # Calculate Est Equity
-equity = pf_state.cash_balance
-for p in pf_state.holdings.values():
-    price = market.get_price(p.ticker) or p.avg_price
-    equity += (p.quantity * price)
+positions = list(pf_state.holdings.values())
+qtys = np.fromiter((p.quantity for p in positions), dtype=np.float64, count=len(positions))
+cost = np.fromiter((p.avg_price for p in positions), dtype=np.float64, count=len(positions))
+prices = market.get_prices([p.ticker for p in positions])
+prices = np.where(np.isnan(prices), cost, prices)  # no live quote -> mark at cost
+equity = pf_state.cash_balance + float(qtys @ prices)
 
 c1.metric("Net Liquidation Value", f"${equity:,.2f}", 
           delta=f"{equity - 100000:,.2f} P&L")
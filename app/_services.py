@@ -0,0 +1,35 @@
+"""Process-wide service handles shared by every Streamlit session and page."""
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from alphacouncil.tools.vol_tools import VolSenseService
+from alphacouncil.data.live_feed import LiveMarketFeed
+from alphacouncil.execution.portfolio import PortfolioService
+
+
+@st.cache_resource
+def vol_service() -> VolSenseService:
+    """Single VolSenseService; cache_resource serializes first construction across sessions."""
+    service = VolSenseService.get_instance()
+    # Start the model load now so the first hydration click doesn't pay for it
+    service.warm_up()
+    return service
+
+
+@st.cache_resource
+def market_feed() -> LiveMarketFeed:
+    """Single LiveMarketFeed (loads the on-disk price snapshot once)."""
+    return LiveMarketFeed.get_instance()
+
+
+@st.cache_resource
+def portfolio() -> PortfolioService:
+    """Single PortfolioService; callers use reload_if_changed() to pick up writes from agents."""
+    return PortfolioService()
+
+
+@st.cache_resource
+def review_pool() -> ThreadPoolExecutor:
+    """Worker threads for agent calls that would otherwise block a session's script run."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-review")
@@ -3,6 +3,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import time
 from dotenv import load_dotenv
 import os
 
@@ -14,7 +15,7 @@ if "TAVILY_API_KEY" in st.secrets:
 load_dotenv()  # Fallback for local development
 
 # Internal Imports
-from alphacouncil.tools.vol_tools import VolSenseService
+from app._services import vol_service as get_vol_service
 from alphacouncil.persistence import get_daily_cache
 from volsense_inference.sector_mapping import get_sector_map
 
@@ -47,64 +48,145 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 2. INITIALIZE SERVICES
-vol_service = VolSenseService.get_instance()
+vol_service = get_vol_service()
 cache = get_daily_cache()
 sector_map = get_sector_map("v507")
 
-# 3. STALE CACHE CHECK (runs on every page load, BEFORE cached function)
+# 3. STALE CACHE CHECK (throttled per session, BEFORE cached function)
 def _check_and_refresh_cache():
-    """Check if cache is stale and trigger refresh if needed. Clears Streamlit cache if stale."""
+    """Check if cache is stale and trigger refresh if needed. Hydration bumps cache.version()."""
     is_stale = hasattr(cache, 'is_stale') and cache.is_stale()
     if not cache._cache or is_stale:
-        # Clear Streamlit's function cache to force reload
-        st.cache_data.clear()
         with st.spinner("🌊 Hydrating Market Data (Cache stale or empty)..."):
             vol_service.hydrate_market()
         return True
     return False
 
-# Run stale check on every page load
-_check_and_refresh_cache()
+# Widget changes rerun the whole script; re-probe the cache at most once a minute per session
+STALE_CHECK_SECONDS = 60
+
+if time.time() - st.session_state.get("_cache_check_ts", 0.0) > STALE_CHECK_SECONDS:
+    _check_and_refresh_cache()
+    st.session_state["_cache_check_ts"] = time.time()
 
 # 4. DATA LOADING FUNCTION (now only builds DataFrame, no stale check)
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def load_market_data():
-    """Load and prepare universe-wide data from cache."""
-    
-    # Build DataFrame from cache
-    rows = []
-    for ticker, payload in cache._cache.items():
-        if "error" in payload:
-            continue
-        
-        signal_block = payload.get("signal", {}) or {}
-        metrics = payload.get("metrics", {}) or {}
-        context = payload.get("context", {}) or {}
-        
-        rows.append({
-            "ticker": ticker,
-            "sector": payload.get("sector", "Unknown"),
-            "signal": signal_block.get("position", "NEUTRAL"),
-            "action": signal_block.get("action", "Wait"),
-            "strength": signal_block.get("strength", 0.0),
-            "z_score": metrics.get("z_score", 0.0),
-            "z_score_1d": metrics.get("z_score_1d", 0.0),
-            "z_score_5d": metrics.get("z_score_5d", 0.0),
-            "z_score_10d": metrics.get("z_score_10d", 0.0),
-            "current_vol": metrics.get("current_vol", 0.0),
-            "forecast_1d": metrics.get("forecast_1d", 0.0),
-            "forecast_5d": metrics.get("forecast_5d", 0.0),
-            "forecast_10d": metrics.get("forecast_10d", 0.0),
-            "vol_spread_pct": metrics.get("vol_spread_pct", 0.0),
-            "term_spread_10v5": metrics.get("term_spread_10v5", 0.0),
-            "momentum_5d": metrics.get("momentum_5d", 0.0),
-            "momentum_20d": metrics.get("momentum_20d", 0.0),
-            "regime": context.get("regime", "Normal"),
-            "sector_z_score": context.get("sector_z_score", 0.0),
-            "rank_in_sector": context.get("rank_in_sector", 0.5),
-        })
-    
-    return pd.DataFrame(rows)
+# Flattened payload field -> (column, default when missing)
+PAYLOAD_COLUMNS = {
+    "sector": ("sector", "Unknown"),
+    "signal_position": ("signal", "NEUTRAL"),
+    "signal_action": ("action", "Wait"),
+    "signal_strength": ("strength", 0.0),
+    "metrics_z_score": ("z_score", 0.0),
+    "metrics_z_score_1d": ("z_score_1d", 0.0),
+    "metrics_z_score_5d": ("z_score_5d", 0.0),
+    "metrics_z_score_10d": ("z_score_10d", 0.0),
+    "metrics_current_vol": ("current_vol", 0.0),
+    "metrics_forecast_1d": ("forecast_1d", 0.0),
+    "metrics_forecast_5d": ("forecast_5d", 0.0),
+    "metrics_forecast_10d": ("forecast_10d", 0.0),
+    "metrics_vol_spread_pct": ("vol_spread_pct", 0.0),
+    "metrics_term_spread_10v5": ("term_spread_10v5", 0.0),
+    "metrics_momentum_5d": ("momentum_5d", 0.0),
+    "metrics_momentum_20d": ("momentum_20d", 0.0),
+    "context_regime": ("regime", "Normal"),
+    "context_sector_z_score": ("sector_z_score", 0.0),
+    "context_rank_in_sector": ("rank_in_sector", 0.5),
+}
+PAYLOAD_BLOCKS = ("signal", "metrics", "context")
+
+def _lacks_field(payload: dict, src: str) -> bool:
+    """True when a flattened field's key is missing from the payload (a None block counts as empty)."""
+    block, _, key = src.partition("_")
+    if block in PAYLOAD_BLOCKS:
+        return key not in (payload.get(block) or {})
+    return src not in payload
+
+
+@st.cache_data(max_entries=2)
+def load_market_data(cache_version: str):
+    """Load and prepare universe-wide data from cache.
+
+    Memoized on `cache_version`, so it rebuilds exactly when the cache changes.
+    """
+    columns = ["ticker"] + [col for col, _ in PAYLOAD_COLUMNS.values()]
+    items = [(t, p) for t, p in cache._cache.items() if "error" not in p]
+    if not items:
+        return pd.DataFrame(columns=columns)
+
+    # Flatten signal/metrics/context in one pass; max_level=1 leaves plot_data unexpanded
+    df = pd.json_normalize([p for _, p in items], sep="_", max_level=1)
+    df = df.reindex(columns=list(PAYLOAD_COLUMNS))
+    # Defaults stand in for absent keys only; a key present with a null value stays NaN
+    for src, (_, default) in PAYLOAD_COLUMNS.items():
+        lacks = [_lacks_field(p, src) for _, p in items]
+        if any(lacks):
+            df.loc[lacks, src] = default
+    df.columns = [col for col, _ in PAYLOAD_COLUMNS.values()]
+    df.insert(0, "ticker", [t for t, _ in items])
+
+    # Halve the numeric payload shipped to Plotly; labels have < 20 distinct values
+    float_cols = df.select_dtypes(include="float").columns
+    df[float_cols] = df[float_cols].astype("float32")
+    df[["sector", "signal", "action"]] = df[["sector", "signal", "action"]].astype("category")
+    return df
+
+@st.cache_data(max_entries=2)
+def filter_options(cache_version: str):
+    """Sorted signal and sector choices for the sidebar; they only change with the data."""
+    df = load_market_data(cache_version)
+    return sorted(df["signal"].unique().tolist()), sorted(df["sector"].unique().tolist())
+
+def filter_market_data(df_full, selected_signal, selected_sectors, z_col, z_threshold):
+    """Apply the sidebar filters through one combined mask and a single indexing copy."""
+    mask = (df_full[z_col] >= z_threshold).to_numpy()
+
+    if selected_signal != "ALL":
+        mask &= (df_full["signal"] == selected_signal).to_numpy()
+
+    # Only filter by sectors if user explicitly selected some
+    if selected_sectors:
+        mask &= df_full["sector"].isin(selected_sectors).to_numpy()
+
+    return df_full.loc[mask]
+
+
+@st.cache_data(max_entries=32)
+def sector_strength(cache_version, selected_signal, selected_sectors, z_col, z_threshold):
+    """Mean strength per sector, sorted; memoized on the data version and the filter values."""
+    df = filter_market_data(
+        load_market_data(cache_version), selected_signal, selected_sectors, z_col, z_threshold
+    )
+    agg = df.groupby("sector", observed=True)["strength"].mean().reset_index()
+    return agg.sort_values("strength", ascending=False)
+
+
+# Above this many tiles the treemap keeps each sector's strongest names and buckets the rest
+TREEMAP_MAX_TILES = 500
+TREEMAP_TOP_PER_SECTOR = 20
+# Above this many tiles only sector blocks render up front; tickers appear on click
+TREEMAP_DRILLDOWN_TILES = 150
+
+
+def cap_treemap(df_tree, z_col):
+    """Keep the top tiles per sector by abs_strength; fold the remainder into one 'Other' tile."""
+    df_tree = df_tree.sort_values("abs_strength", ascending=False)
+    rank = df_tree.groupby("sector").cumcount()
+    head = df_tree[rank < TREEMAP_TOP_PER_SECTOR]
+    tail = df_tree[rank >= TREEMAP_TOP_PER_SECTOR]
+    if tail.empty:
+        return head
+
+    other = tail.groupby("sector", as_index=False).agg(
+        abs_strength=("abs_strength", "sum"),
+        z=(z_col, "mean"),
+        n=("ticker", "size"),
+    )
+    other = other.rename(columns={"z": z_col})
+    other["ticker"] = "Other (" + other.pop("n").astype(str) + ")"
+    other["signal"] = "—"
+    other["regime"] = "—"
+    return pd.concat([head, other], ignore_index=True)
+
 
 # 4. SIDEBAR CONTROLS
 with st.sidebar:
@@ -113,7 +195,6 @@ with st.sidebar:
     if st.button("🔄 Hydrate Market", type="primary"):
         with st.spinner("Refreshing VolSense Engine..."):
             vol_service.hydrate_market()
-            st.cache_data.clear()  # Clear cache to reload data
             st.success("✅ Market Data Refreshed!")
             st.rerun()
     
@@ -121,14 +202,15 @@ with st.sidebar:
     st.subheader("🎯 Filters")
     
     # Load data for filter options
-    df_full = load_market_data()
+    cache_version = cache.version()
+    df_full = load_market_data(cache_version)
+    signal_choices, sector_options = filter_options(cache_version)
     
     # Signal Type Filter
-    signal_options = ["ALL"] + sorted(df_full["signal"].unique().tolist())
+    signal_options = ["ALL"] + signal_choices
     selected_signal = st.selectbox("Signal Type", signal_options, index=0)
     
     # Sector Filter (Multi-select) - Don't use default parameter, show all by default
-    sector_options = sorted(df_full["sector"].unique().tolist())
     selected_sectors = st.multiselect("Sectors", sector_options)
     
     # Z-Score Threshold (default to minimum to show all tickers)
@@ -150,16 +232,8 @@ with st.sidebar:
     st.caption(f"📊 Last Cache Update: {cache._today_str()}")
 
 # 5. APPLY FILTERS
-df = df_full.copy()
-
-if selected_signal != "ALL":
-    df = df[df["signal"] == selected_signal]
-
-# Only filter by sectors if user explicitly selected some
-if selected_sectors and len(selected_sectors) > 0:
-    df = df[df["sector"].isin(selected_sectors)]
-
-df = df[df[selected_z_col] >= z_threshold]
+filter_args = (selected_signal, tuple(selected_sectors), selected_z_col, z_threshold)
+df = filter_market_data(df_full, *filter_args)
 
 # 6. MAIN UI HEADER
 st.title("📐 The Technician's Console")
@@ -186,16 +260,13 @@ st.divider()
 st.markdown(f"### 🗺️ Volatility Universe Heatmap ({horizon_option} Forecast)")
 
 if len(df) > 0:
-    # Prepare data for treemap
-    df_tree = df.copy()
-    df_tree["abs_strength"] = df_tree["strength"].abs()  # Size by absolute strength
-    df_tree["hover_text"] = (
-        df_tree["ticker"] + "<br>" +
-        "Signal: " + df_tree["signal"] + "<br>" +
-        "Z-Score (" + horizon_option + "): " + df_tree[selected_z_col].round(2).astype(str) + "<br>" +
-        "Regime: " + df_tree["regime"] + "<br>" +
-        "Sector: " + df_tree["sector"]
+    # Prepare data for treemap: only the columns the figure reads, not a full-width copy
+    df_tree = df[["sector", "ticker", selected_z_col, "signal", "regime"]].assign(
+        abs_strength=df["strength"].abs(),  # Size by absolute strength
+        sector=df["sector"].astype(str),  # treemap path fills with new labels
     )
+    if len(df_tree) > TREEMAP_MAX_TILES:
+        df_tree = cap_treemap(df_tree, selected_z_col)
     
     fig_tree = px.treemap(
         df_tree,
@@ -218,6 +289,9 @@ if len(df) > 0:
         hovertemplate='<b>%{label}</b><br>Z-Score: %{color:.2f}<br>Signal: %{customdata[0]}<br>Regime: %{customdata[1]}<extra></extra>',
         textposition='middle center'
     )
+    if len(df_tree) > TREEMAP_DRILLDOWN_TILES:
+        fig_tree.update_traces(maxdepth=1)
+        st.caption("Click a sector to drill into its tickers.")
     
     st.plotly_chart(fig_tree, width='stretch')
 else:
@@ -233,26 +307,29 @@ with col_table:
     
     if len(df) > 0:
         # Sort by signal strength and take top 20
-        df_top = df.nlargest(20, "strength").copy()
+        # Series.nlargest is a partial selection (no full sort); index rows and columns once
+        top_idx = df["strength"].nlargest(20).index
         
-        # Format for display
-        df_display = df_top[[
+        # Stays numeric (sorts correctly in the widget); the browser does the formatting
+        df_display = df.loc[top_idx, [
             "ticker", "sector", "signal", "z_score", 
             "vol_spread_pct", "term_spread_10v5", "momentum_5d"
-        ]].copy()
-        
-        df_display.columns = [
-            "Ticker", "Sector", "Signal", "Z-Score", 
-            "Vol Spread %", "Term Spread", "Mom 5d"
-        ]
+        ]]
         
-        # Format numeric columns
-        df_display["Z-Score"] = df_display["Z-Score"].round(2)
-        df_display["Vol Spread %"] = (df_display["Vol Spread %"] * 100).round(2).astype(str) + "%"
-        df_display["Term Spread"] = df_display["Term Spread"].round(4)
-        df_display["Mom 5d"] = (df_display["Mom 5d"] * 100).round(2).astype(str) + "%"
-        
-        st.dataframe(df_display, hide_index=True, width='stretch')
+        st.dataframe(
+            df_display,
+            hide_index=True,
+            width='stretch',
+            column_config={
+                "ticker": "Ticker",
+                "sector": "Sector",
+                "signal": "Signal",
+                "z_score": st.column_config.NumberColumn("Z-Score", format="%.2f"),
+                "vol_spread_pct": st.column_config.NumberColumn("Vol Spread %", format="percent"),
+                "term_spread_10v5": st.column_config.NumberColumn("Term Spread", format="%.4f"),
+                "momentum_5d": st.column_config.NumberColumn("Mom 5d", format="percent"),
+            },
+        )
     else:
         st.info("No setups available with current filters.")
 
@@ -260,7 +337,7 @@ with col_regime:
     st.markdown("### 🌡️ Regime Distribution")
     
     if len(df) > 0:
-        regime_dist = df["regime"].value_counts().reset_index()
+        regime_dist = regime_counts.reset_index()  # same counts as the KPI strip
         regime_dist.columns = ["Regime", "Count"]
         
         fig_regime = px.pie(
@@ -289,18 +366,17 @@ st.divider()
 st.markdown("### 📈 Sector Signal Strength")
 
 if len(df) > 0:
-    sector_strength = df.groupby("sector")["strength"].mean().reset_index()
-    sector_strength = sector_strength.sort_values("strength", ascending=False)
+    sector_avg = sector_strength(cache_version, *filter_args)
     
     # Color code by strength (positive = green, negative = red)
-    colors = ['#00FF00' if x > 0 else '#FF4444' for x in sector_strength["strength"]]
+    colors = ['#00FF00' if x > 0 else '#FF4444' for x in sector_avg["strength"]]
     
     fig_sector = go.Figure(data=[
         go.Bar(
-            x=sector_strength["sector"],
-            y=sector_strength["strength"],
+            x=sector_avg["sector"],
+            y=sector_avg["strength"],
             marker_color=colors,
-            text=sector_strength["strength"].round(3),
+            text=sector_avg["strength"].round(3),
             textposition='outside'
         )
     ])
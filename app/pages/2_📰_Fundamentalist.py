@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import asyncio
+from collections import deque
 from datetime import datetime
 from dotenv import load_dotenv
 import importlib
@@ -79,10 +80,17 @@ SECTOR_REPRESENTATIVES = {
     "Index/ETF": "SPY",
     "Volatility / Hedge": "VXX"
 }
+SECTOR_NAMES = tuple(sorted(SECTOR_REPRESENTATIVES))
+
+# Ticker -> sector lookup for the Deep Dive caption
+sector_map = get_sector_map("v507")
+
+# Concurrent agent runs in a sector scan; each is Tavily + LLM I/O bound
+SCAN_CONCURRENCY = 5
 
 # 3. INITIALIZE SESSION STATE
 if "analysis_history" not in st.session_state:
-    st.session_state["analysis_history"] = []
+    st.session_state["analysis_history"] = deque(maxlen=5)  # newest first, oldest drops off
 
 if "current_analysis" not in st.session_state:
     st.session_state["current_analysis"] = None
@@ -94,6 +102,8 @@ def render_risk_badge(risk_level: str):
 
 def render_sentiment_gauge(score: float):
     """Render sentiment gauge using Plotly."""
+    import plotly.graph_objects as go
+
     # Convert -1.0 to 1.0 → 0 to 100
     percentage = (score + 1) * 50
     
@@ -139,44 +149,68 @@ def render_sentiment_gauge(score: float):
     
     return fig
 
+def run_analysis(mode: str, query: str) -> dict:
+    """Run the fundamentalist agent for one query. No Streamlit calls, so safe off-thread."""
+    # Determine ticker to use
+    if mode == "Sector Scan":
+        ticker = SECTOR_REPRESENTATIVES.get(query, "AAPL")
+    else:
+        ticker = query.upper()
+    
+    # Call agent with mode context
+    state = {
+        "ticker": ticker, 
+        "messages": [], 
+        "expanded": True,
+        "mode": mode,  # "Sector Scan" or "Ticker Deep Dive"
+    }
+    # For Sector Scan, also pass the sector name directly
+    if mode == "Sector Scan":
+        state["sector"] = query  # query is the selected sector name
+    
+    result = fundamentalist_agent(state)
+    intel: SectorIntel = result["fundamental_signal"]
+    
+    return {
+        "mode": mode,
+        "query": query,
+        "ticker": ticker,
+        "timestamp": datetime.now(),
+        "intel": intel
+    }
+
+async def analyze_many(mode: str, queries: list[str]) -> list:
+    """Run several analyses concurrently (capped); failures come back as exceptions."""
+    gate = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def one(query):
+        async with gate:
+            return await asyncio.to_thread(run_analysis, mode, query)
+
+    return await asyncio.gather(*(one(q) for q in queries), return_exceptions=True)
+
+def scan_all_sectors():
+    """Analyze every sector representative at once and keep the results for the overview."""
+    sectors = list(SECTOR_NAMES)
+    with st.spinner(f"🛰️ Scanning {len(sectors)} sectors..."):
+        results = asyncio.run(analyze_many("Sector Scan", sectors))
+    scan = [r for r in results if isinstance(r, dict)]
+    failed = [s for s, r in zip(sectors, results) if isinstance(r, Exception)]
+    if failed:
+        st.warning(f"Scan failed for: {', '.join(failed)}")
+    st.session_state["sector_scan"] = scan
+
 def analyze_query(mode: str, query: str):
     """Run fundamentalist agent analysis."""
     with st.spinner(f"🔍 Analyzing {query}..."):
         try:
-            # Determine ticker to use
-            if mode == "Sector Scan":
-                ticker = SECTOR_REPRESENTATIVES.get(query, "AAPL")
-            else:
-                ticker = query.upper()
-            
-            # Call agent with mode context
-            state = {
-                "ticker": ticker, 
-                "messages": [], 
-                "expanded": True,
-                "mode": mode,  # "Sector Scan" or "Ticker Deep Dive"
-            }
-            # For Sector Scan, also pass the sector name directly
-            if mode == "Sector Scan":
-                state["sector"] = query  # query is the selected sector name
-            
-            result = fundamentalist_agent(state)
-            intel: SectorIntel = result["fundamental_signal"]
+            analysis = run_analysis(mode, query)
             
             # Store in session state
-            analysis = {
-                "mode": mode,
-                "query": query,
-                "ticker": ticker,
-                "timestamp": datetime.now(),
-                "intel": intel
-            }
-            
             st.session_state["current_analysis"] = analysis
             
-            # Add to history (limit to 5)
-            st.session_state["analysis_history"].insert(0, analysis)
-            st.session_state["analysis_history"] = st.session_state["analysis_history"][:5]
+            # Add to history (the deque keeps the last 5)
+            st.session_state["analysis_history"].appendleft(analysis)
             
             return True
             
@@ -199,39 +233,57 @@ with st.sidebar:
     
     # Query input based on mode
     if mode == "Sector Scan":
-        sector_options = sorted(SECTOR_REPRESENTATIVES.keys())
-        query = st.selectbox("Select Sector", sector_options)
+        query = st.selectbox("Select Sector", SECTOR_NAMES)
         st.caption(f"Representative: {SECTOR_REPRESENTATIVES[query]}")
     else:
         query = st.text_input("Enter Ticker", value="NVDA").upper()
-        sector_map = get_sector_map("v507")
         if query in sector_map:
             st.caption(f"Sector: {sector_map[query]}")
         else:
             st.warning("⚠️ Ticker not in v507 universe")
     
-    # Analyze button
+    # Analyze button. History and the main panel render below this point, so the
+    # updated session state shows up in this same pass without a second rerun.
     if st.button("🔍 Analyze", type="primary", width='stretch'):
         analyze_query(mode, query)
-        st.rerun()
+    
+    if mode == "Sector Scan" and st.button("🛰️ Scan All Sectors", width='stretch'):
+        scan_all_sectors()
     
     st.divider()
     
     # Analysis history
     if st.session_state["analysis_history"]:
         st.subheader("📚 Recent Analyses")
-        for i, analysis in enumerate(st.session_state["analysis_history"][:5]):
+        for i, analysis in enumerate(st.session_state["analysis_history"]):
             timestamp = analysis["timestamp"].strftime("%H:%M:%S")
             label = f"{analysis['query']} ({timestamp})"
             
             if st.button(label, key=f"history_{i}", width='stretch'):
                 st.session_state["current_analysis"] = analysis
-                st.rerun()
 
 # 6. MAIN LAYOUT
 st.title("📰 The Fundamentalist's Study")
 st.caption("Sector-Wide News Analysis & Sentiment Intelligence")
 
+# Sector scan overview (from "Scan All Sectors")
+if st.session_state.get("sector_scan"):
+    st.markdown("### 🛰️ Sector Scan Overview")
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Sector": a["query"],
+                "Ticker": a["ticker"],
+                "Risk": a["intel"].risk_level,
+                "Sentiment": a["intel"].sentiment_score,
+            }
+            for a in st.session_state["sector_scan"]
+        ]).sort_values("Sentiment"),
+        hide_index=True,
+        width='stretch'
+    )
+    st.divider()
+
 # Display current analysis
 if st.session_state["current_analysis"]:
     analysis = st.session_state["current_analysis"]
@@ -1,8 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+import time
 from dotenv import load_dotenv
 
 # STREAMLIT CLOUD
@@ -14,12 +13,21 @@ if "TAVILY_API_KEY" in st.secrets:
 load_dotenv()  # Fallback for local development
 # --- Internal Imports ---
 from alphacouncil.graph import app as graph_app
-from alphacouncil.tools.vol_tools import VolSenseService
-from volsense_inference.sector_mapping import get_color
+from alphacouncil.persistence import get_daily_cache
+from app._services import vol_service as get_vol_service, portfolio as get_portfolio
 from volsense_inference.sector_mapping import get_sector_map
 
+# A repeat click for the same ticker inside this window reuses the last verdict
+RESULT_REUSE_SECONDS = 300
+
 # Load the allowed universe keys for validation
-VALID_UNIVERSE = set(get_sector_map("v507").keys())
+@st.cache_resource
+def _valid_universe() -> frozenset[str]:
+    """Built once per process; page scripts otherwise re-run this on every interaction."""
+    return frozenset(get_sector_map("v507"))
+
+
+VALID_UNIVERSE = _valid_universe()
 
 # 1. PAGE CONFIG
 st.set_page_config(
@@ -64,40 +72,54 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 2. HELPER FUNCTIONS
+@st.cache_data(show_spinner=False, max_entries=64)
+def run_scope(ticker: str, cache_version: str, ledger_version: int) -> dict:
+    """Full council run, memoized per ticker on the vol cache contents and the portfolio ledger.
+
+    The risk verdict depends on cash and holdings, so any trade invalidates it; cache.version()
+    also rolls over at midnight, unlike get_cache_date().
+    """
+    return graph_app.invoke({"ticker": ticker})
+
+
+FORECAST_COLORS = {"1": "#ffcc00", "5": "#ff6666", "10": "#cc99ff"}
+
+
 def render_chart_from_json(ticker, plot_data):
+    # Plotly is only needed once a verdict is on screen; keep it off the cold page load
+    import plotly.express as px
+
     if not plot_data or "history" not in plot_data:
         st.warning("No historical data available for plotting.")
         return
 
-    history = plot_data["history"]
-    df = pd.DataFrame(history)
+    df = pd.DataFrame(plot_data["history"])
     df["date"] = pd.to_datetime(df["date"])
-    
-    forecasts = plot_data.get("forecasts", {})
 
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    # Plot Realized Vol
-    ax.plot(df["date"], df["realized_vol"], label="Realized Vol", color="#4da6ff", linewidth=2)
-    
-    # Plot Forecast Lines
-    colors = {"1": "#ffcc00", "5": "#ff6666", "10": "#cc99ff"}
-    for horizon, val in forecasts.items():
+    # Plotly ships JSON to the browser; no server-side raster, same stack as the other pages
+    fig = px.line(df, x="date", y="realized_vol", height=360)
+    fig.update_traces(line=dict(color="#4da6ff", width=2), name="Realized Vol", showlegend=True)
+    for horizon, val in plot_data.get("forecasts", {}).items():
         if val is not None:
-            ax.axhline(y=val, color=colors.get(horizon, "white"), linestyle="--", alpha=0.8, label=f"{horizon}d Forecast")
-
-    ax.set_title(f"{ticker} — Volatility Term Structure", color="white")
-    ax.set_facecolor("#1a1c24")
-    fig.patch.set_facecolor("#1a1c24")
-    ax.tick_params(axis='x', colors='white')
-    ax.tick_params(axis='y', colors='white')
-    ax.spines['bottom'].set_color('#444')
-    ax.spines['left'].set_color('#444')
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    
-    plt.legend(facecolor="#2d2f3a", labelcolor="white", framealpha=1)
-    st.pyplot(fig, width='stretch')
+            fig.add_hline(
+                y=val,
+                line_dash="dash",
+                line_color=FORECAST_COLORS.get(horizon, "white"),
+                opacity=0.8,
+                annotation_text=f"{horizon}d Forecast",
+                annotation_position="top left",
+            )
+
+    fig.update_layout(
+        title=f"{ticker} — Volatility Term Structure",
+        xaxis_title=None,
+        yaxis_title="Volatility",
+        yaxis_tickformat=".0%",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="#1a1c24",
+        margin=dict(t=40, l=0, r=0, b=0),
+    )
+    st.plotly_chart(fig, width='stretch')
 
 
 def render_volsense_stats(ticker, raw_data):
@@ -129,6 +151,9 @@ def render_volsense_stats(ticker, raw_data):
             c_obj.metric(label, fmt.format(val))
 
     st.markdown("### 📉 Volatility Chart")
+    # The chart is the heaviest part of the page; build it only when asked for
+    if not st.checkbox("Show volatility chart", value=False, key="scope_show_chart"):
+        return
     plot_data = raw_data.get("plot_data", {})
     if plot_data:
         render_chart_from_json(ticker, plot_data)
@@ -138,24 +163,36 @@ def render_volsense_stats(ticker, raw_data):
 # 3. SIDEBAR CONTROLS
 with st.sidebar:
     st.header("🔬 Scope Controls")
-    ticker_input = st.text_input("Target Ticker", value="NVDA").upper()
+    ticker_input = st.text_input("Target Ticker", value="NVDA").strip().upper()
     
     if st.button("📡 Analyze Ticker", type="primary"):
+        result_age = time.time() - st.session_state.get("scope_ts", 0)
         if ticker_input not in VALID_UNIVERSE:
             st.error(f"⛔ {ticker_input} is not in the v507 Universe.")
+        elif (
+            st.session_state.get("scope_ticker") == ticker_input
+            and "scope_result" in st.session_state
+            and result_age < RESULT_REUSE_SECONDS
+        ):
+            st.info(f"Using the {ticker_input} analysis from {int(result_age // 60)} min ago.")
         else:
             with st.spinner(f"Running Deep Dive on {ticker_input}..."):
                 try:
-                    response = graph_app.invoke({"ticker": ticker_input})
+                    response = run_scope(
+                        ticker_input,
+                        get_daily_cache().version(),
+                        get_portfolio().ledger_version(),
+                    )
                     st.session_state["scope_result"] = response
                     st.session_state["scope_ticker"] = ticker_input
+                    st.session_state["scope_ts"] = time.time()
                 except Exception as e:
                     st.error(f"Analysis Failed: {e}")
     
     st.divider()
     
     if st.button("🔄 Hydrate Market Data"):
-        service = VolSenseService.get_instance()
+        service = get_vol_service()
         with st.spinner("Refreshing VolSense Engine..."):
             try:
                 service._ensure_loaded()
@@ -2,6 +2,7 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import os
+import hashlib
 from pathlib import Path
 from datetime import datetime, date
 from tqdm import tqdm
@@ -13,12 +14,32 @@ from typing import Union, List, Dict
 _DAILY_CACHE_DIR = Path(os.environ.get("VOLSENSE_CACHE_DIR", ".volsense_cache"))
 
 
+def set_daily_cache_dir(path: str | os.PathLike) -> None:
+    """
+    Point the daily batch cache at a persistent directory.
+
+    The default location is relative to the working directory, so callers
+    launched from different folders would otherwise re-download the same day.
+
+    :param path: Directory for daily parquet caches (created on first save).
+    :type path: str or os.PathLike
+    """
+    global _DAILY_CACHE_DIR
+    _DAILY_CACHE_DIR = Path(path)
+
+
 def _get_daily_cache_path(cache_key: str) -> Path:
     """Get the path to today's daily cache file."""
     today_str = date.today().strftime("%Y%m%d")
     return _DAILY_CACHE_DIR / f"{cache_key}_{today_str}.parquet"
 
 
+def _batch_cache_key(prefix: str, tickers: List[str]) -> str:
+    """Key a batch cache on the exact ticker set, not just its size."""
+    digest = hashlib.md5(",".join(sorted(tickers)).encode()).hexdigest()[:10]
+    return f"{prefix}_{len(tickers)}_{digest}"
+
+
 def _load_daily_cache(cache_key: str) -> pd.DataFrame | None:
     """Load today's cached data if it exists."""
     cache_path = _get_daily_cache_path(cache_key)
@@ -36,8 +57,8 @@ def _save_daily_cache(df: pd.DataFrame, cache_key: str) -> None:
     cache_path = _get_daily_cache_path(cache_key)
     try:
         df.to_parquet(cache_path, index=False)
-        # Clean up old cache files (keep only last 3 days)
-        _cleanup_old_caches(cache_key, keep_days=3)
+        # Clean up old cache files (keep only last 3 days) across all ticker sets
+        _cleanup_old_caches(cache_key.split("_", 1)[0], keep_days=3)
     except Exception as e:
         print(f"⚠️ Failed to save cache: {e}")
 
@@ -100,7 +121,7 @@ def fetch_ohlcv(
 
     # --- Daily Cache Check (for batch requests) ---
     if use_daily_cache and len(tickers) > 1:
-        cache_key = f"ohlcv_batch_{len(tickers)}"
+        cache_key = _batch_cache_key("ohlcv_batch", tickers)
         cached_df = _load_daily_cache(cache_key)
         if cached_df is not None:
             print(f"✅ Loaded {len(tickers)} tickers from daily cache")
@@ -129,11 +150,13 @@ def fetch_ohlcv(
             )
             
             out_dict = {}
+            is_multi = isinstance(raw_df.columns, pd.MultiIndex)
+            downloaded = set(raw_df.columns.get_level_values(0)) if is_multi else set()
             for tkr in tickers:
                 try:
-                    if isinstance(raw_df.columns, pd.MultiIndex):
+                    if is_multi:
                         # Multi-ticker format: columns are (Ticker, Field)
-                        if tkr in raw_df.columns.get_level_values(0):
+                        if tkr in downloaded:
                             df_tkr = raw_df[tkr].copy()
                         else:
                             continue
@@ -454,7 +477,7 @@ def fetch_earnings_dates(
     
     # --- Daily Cache Check ---
     if use_daily_cache:
-        cache_key = f"earnings_{len(tickers)}"
+        cache_key = _batch_cache_key("earnings", tickers)
         cached_df = _load_daily_cache(cache_key)
         if cached_df is not None:
             print(f"✅ Loaded earnings from daily cache")
@@ -10,7 +10,6 @@ This module is intended for use within volsense_inference.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import List, Optional
 
 
@@ -190,6 +189,8 @@ class Analytics:
         :return: Matplotlib Figure when show=False; otherwise None.
         :rtype: matplotlib.figure.Figure or None
         """
+        import matplotlib.pyplot as plt
+
         if self.processed is None:
             self.compute()
         df = self.processed.copy()
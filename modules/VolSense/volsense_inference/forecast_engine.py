@@ -38,12 +38,11 @@ Notes
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
 from volsense_inference.model_loader import load_model
 from volsense_inference.predictor import predict_batch, attach_realized
-from volsense_core.data.fetch import build_dataset
+from volsense_core.data.fetch import build_dataset, set_daily_cache_dir
 from volsense_core.data.feature_engineering import build_features
 from volsense_inference.analytics import Analytics
 
@@ -93,6 +92,7 @@ class Forecast:
         model_version: str = "v109",
         checkpoints_dir: str = "models",
         start: str = "2005-01-01",
+        cache_dir: str | None = None,
     ):
         """
         Initialize the Forecast runtime by loading pretrained assets.
@@ -103,11 +103,16 @@ class Forecast:
         :type checkpoints_dir: str
         :param start: Start date for fetching recent data to build features.
         :type start: str
+        :param cache_dir: Optional persistent directory for the daily OHLCV/earnings cache.
+        :type cache_dir: str, optional
         """
         print(f"🚀 Initializing VolSense.Forecast (model={model_version})")
         self.model_version = model_version
         self.checkpoints_dir = checkpoints_dir
         self.start = start
+        self.cache_dir = cache_dir
+        if cache_dir:
+            set_daily_cache_dir(cache_dir)
 
         # Load model and assets
         self.model, self.meta, self.scalers, self.ticker_to_id, self.features = (
@@ -180,15 +185,20 @@ class Forecast:
         self.df_recent = df_recent
         return df_recent
 
-    def run(self, tickers):
+    def run(self, tickers, batch_size: int = 64):
         """
         Generate multi-horizon forecasts for one or more tickers.
 
         Prepares recent data, runs batched predictions, attaches realized volatility,
         and computes cross-sectional analytics for convenience.
 
+        Feature engineering always runs over the full ticker list (market_stress is
+        cross-sectional); only the model forward pass is tiled by ``batch_size``.
+
         :param tickers: Ticker symbol or list of symbols to forecast.
         :type tickers: str or list[str]
+        :param batch_size: Number of tickers stacked into each forward pass.
+        :type batch_size: int
         :return: Forecast snapshot with columns like ['ticker','pred_vol_1','pred_vol_5',...,'realized_vol'].
         :rtype: pandas.DataFrame
         """
@@ -204,6 +214,7 @@ class Forecast:
             scalers=self.scalers,
             ticker_to_id=self.ticker_to_id,
             features=self.features,
+            batch_size=batch_size,
         )
         preds = attach_realized(preds, df_recent)
         
@@ -274,6 +285,8 @@ class Forecast:
         :return: Matplotlib Figure when show=False; otherwise None.
         :rtype: matplotlib.figure.Figure or None
         """
+        import matplotlib.pyplot as plt
+
         if self.predictions is None:
             raise RuntimeError("No forecasts computed yet. Run .run(ticker) first.")
 
@@ -134,6 +134,63 @@ def _forward(model, X: torch.Tensor, tid_tensor: Optional[torch.Tensor]) -> np.n
         return out.cpu().numpy().reshape(-1)
 
 
+def _targets_log_vol(meta: Dict[str, Any]) -> bool:
+    """
+    Decide whether raw model outputs are log-volatility and need exponentiation.
+
+    Priority order:
+      1) meta["config"]["target_col"]
+      2) meta["target_col"]
+      3) default assume log if the architecture is a global / VolNetX model
+
+    :param meta: Model metadata/config dictionary.
+    :type meta: dict
+    :return: True if outputs should be passed through np.exp.
+    :rtype: bool
+    """
+    tc_from_config = meta.get("config", {}).get("target_col")
+    tc_fallback = meta.get("target_col", None)
+
+    target_col_name = tc_from_config or tc_fallback or ""
+
+    # heuristic: many of our models forecast log-vol
+    looks_like_log = (
+        "_log" in target_col_name.lower()
+        or target_col_name.lower().endswith("log")
+        or "vol_log" in target_col_name.lower()
+    )
+
+    # ultimate fallback for older global models where we forgot to store target_col:
+    # global models (v5xx) *always* train on realized_vol_log right now.
+    # VolNetX also uses realized_vol_log by default
+    if not looks_like_log:
+        arch_name = str(meta.get("arch", "")).lower()
+        if "globalvolforecaster" in arch_name or "volnetx" in arch_name:
+            looks_like_log = True
+
+    return looks_like_log
+
+
+def _format_prediction(ticker: str, yhat: np.ndarray, horizons: List[int]) -> Dict[str, float]:
+    """
+    Map a single ticker's output vector onto {'ticker', 'pred_vol_<h>', ...}.
+
+    :param ticker: Ticker symbol the outputs belong to.
+    :type ticker: str
+    :param yhat: 1D array of (already exponentiated) outputs, one per horizon.
+    :type yhat: numpy.ndarray
+    :param horizons: Forecast horizons in model output order.
+    :type horizons: list[int]
+    :return: Dictionary with 'ticker' and predicted volatility per horizon.
+    :rtype: dict[str, float]
+    """
+    preds = {
+        f"pred_vol_{h}": float(yhat[i]) if i < len(yhat) else np.nan
+        for i, h in enumerate(horizons)
+    }
+    return {"ticker": ticker, **preds}
+
+
 # ---------------------------------------------------------------------------
 # 🎯 Core prediction logic
 # ---------------------------------------------------------------------------
@@ -208,41 +265,56 @@ def predict_single(
 
     yhat = _forward(model, X, tid_tensor)
 
-    # --- EXPONENTIATION SAFETY LOGIC ---
-    # Priority order:
-    #   1. meta["config"]["target_col"]
-    #   2. meta["target_col"]
-    #   3. default assume log if model name smells like global / v5xx
-    tc_from_config = meta.get("config", {}).get("target_col")
-    tc_fallback = meta.get("target_col", None)
-
-    target_col_name = tc_from_config or tc_fallback or ""
+    if _targets_log_vol(meta):
+        yhat = np.exp(yhat)
 
-    # heuristic: many of our models forecast log-vol
-    looks_like_log = (
-        "_log" in target_col_name.lower()
-        or target_col_name.lower().endswith("log")
-        or "vol_log" in target_col_name.lower()
-    )
+    horizons = meta.get("horizons", [1])
+    return _format_prediction(ticker, yhat, horizons)
 
-    # ultimate fallback for older global models where we forgot to store target_col:
-    # global models (v5xx) *always* train on realized_vol_log right now.
-    # VolNetX also uses realized_vol_log by default
-    if not looks_like_log:
-        arch_name = str(meta.get("arch", "")).lower()
-        if "globalvolforecaster" in arch_name or "volnetx" in arch_name:
-            looks_like_log = True
 
-    if looks_like_log:
-        yhat = np.exp(yhat)
+def _build_windows(
+    groups: Dict[str, pd.DataFrame],
+    tickers: List[str],
+    feats: List[str],
+    window: int,
+    scalers: Optional[Dict[str, Any]],
+    ticker_to_id: Optional[Dict[str, int]],
+):
+    """
+    Scale and stack the trailing input window for each ticker in a tile.
 
-    horizons = meta.get("horizons", [1])
-    preds = {
-        f"pred_vol_{h}": float(yhat[i]) if i < len(yhat) else np.nan
-        for i, h in enumerate(horizons)
-    }
+    :param groups: Mapping of ticker -> date-sorted feature frame.
+    :type groups: dict[str, pandas.DataFrame]
+    :param tickers: Tickers belonging to this tile.
+    :type tickers: list[str]
+    :param feats: Ordered feature columns expected by the model.
+    :type feats: list[str]
+    :param window: Input window length.
+    :type window: int
+    :param scalers: Optional dict mapping ticker -> fitted scaler.
+    :type scalers: dict[str, Any], optional
+    :param ticker_to_id: Optional mapping from ticker to integer ID.
+    :type ticker_to_id: dict[str, int], optional
+    :return: Tuple (X [B, W, F] array or None, ticker ids [B], kept tickers, skipped (ticker, reason) pairs).
+    :rtype: tuple
+    """
+    xs, tids, kept, skipped = [], [], [], []
+    for t in tickers:
+        df_t = groups.get(t)
+        n_rows = 0 if df_t is None else len(df_t)
+        if n_rows < window:
+            skipped.append((t, f"insufficient data ({n_rows} rows, need {window})"))
+            continue
+        try:
+            df_t = _scale_features(df_t, feats, t, scalers)
+            xs.append(df_t.iloc[-window:][feats].to_numpy(dtype=np.float32))
+            tids.append(ticker_to_id.get(t, 0) if ticker_to_id else 0)
+            kept.append(t)
+        except Exception as e:
+            skipped.append((t, str(e)))
 
-    return {"ticker": ticker, **preds}
+    X = np.stack(xs) if xs else None
+    return X, tids, kept, skipped
 
 
 def predict_batch(
@@ -253,10 +325,17 @@ def predict_batch(
     scalers: Optional[Dict[str, Any]] = None,
     ticker_to_id: Optional[Dict[str, int]] = None,
     features: Optional[List[str]] = None,
+    batch_size: int = 64,
 ) -> pd.DataFrame:
     """
     Run predictions for a list of tickers and return a tidy DataFrame.
 
+    Tickers are processed in tiles of ``batch_size``: each tile's input windows are
+    stacked into a single [B, W, F] tensor and sent through one forward pass. This
+    bounds peak memory (no single 500-ticker allocation) while avoiding one forward
+    call per ticker. The next tile's windows are prepared on a worker thread while
+    the current tile runs through the model.
+
     Exceptions for individual tickers are caught and printed; failed tickers are skipped.
 
     :param model: Loaded model used for inference.
@@ -273,25 +352,79 @@ def predict_batch(
     :type ticker_to_id: dict[str, int], optional
     :param features: Optional explicit feature list to override meta-derived list.
     :type features: list[str], optional
+    :param batch_size: Number of tickers per forward pass.
+    :type batch_size: int
     :return: DataFrame with columns ['ticker','pred_vol_...'] for available horizons.
     :rtype: pandas.DataFrame
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    feats = _get_feature_list(meta, features)
+    missing = [f for f in feats if f not in df.columns]
+    if missing:
+        print(f"⚠️ missing features {missing}, filling with 0.")
+        df = df.copy()
+        for f in missing:
+            df[f] = 0.0
+
+    window = int(meta.get("window", meta.get("lookback", 30)))
+    horizons = meta.get("horizons", [1])
+    exp_outputs = _targets_log_vol(meta)
+
+    # One sort + split instead of a boolean scan per ticker
+    wanted = set(tickers)
+    groups = {
+        t: g
+        for t, g in df[["date", "ticker"] + feats]
+        .sort_values(["ticker", "date"])
+        .groupby("ticker", sort=False)
+        if t in wanted
+    }
+
+    tiles = [tickers[i:i + batch_size] for i in range(0, len(tickers), max(batch_size, 1))]
     rows = []
     failed_tickers = []
-    
-    for t in tqdm(tickers, desc="Forecasting"):
-        try:
-            rows.append(
-                predict_single(model, meta, df, t, scalers, ticker_to_id, features)
-            )
-        except ValueError as e:
-            # Track insufficient data failures separately
-            if "insufficient data" in str(e):
-                failed_tickers.append(t)
-            print(f"⚠️ {t}: {e}")
-        except Exception as e:
-            print(f"⚠️ {t}: {e}")
-    
+
+    def _prepare(tile):
+        return _build_windows(groups, tile, feats, window, scalers, ticker_to_id)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_prepare, tiles[0]) if tiles else None
+        for i in tqdm(range(len(tiles)), desc="Forecasting"):
+            X, tids, kept, skipped = pending.result()
+            if i + 1 < len(tiles):
+                pending = pool.submit(_prepare, tiles[i + 1])
+
+            for t, reason in skipped:
+                if "insufficient data" in reason:
+                    failed_tickers.append(t)
+                print(f"⚠️ {t}: {reason}")
+
+            if X is None:
+                continue
+
+            try:
+                yhat = _forward(
+                    model,
+                    torch.from_numpy(X),
+                    torch.tensor(tids, dtype=torch.long),
+                ).reshape(len(kept), -1)
+            except Exception as e:
+                # Fall back to per-ticker passes so one bad tile doesn't drop 64 tickers
+                print(f"⚠️ batched forward failed ({e}); retrying tile per ticker")
+                for t in kept:
+                    try:
+                        rows.append(
+                            predict_single(model, meta, df, t, scalers, ticker_to_id, features)
+                        )
+                    except Exception as e_single:
+                        print(f"⚠️ {t}: {e_single}")
+                continue
+
+            if exp_outputs:
+                yhat = np.exp(yhat)
+            rows.extend(_format_prediction(t, y, horizons) for t, y in zip(kept, yhat))
+
     # Report summary of failures
     if failed_tickers:
         print(f"\n⚠️ WARNING: {len(failed_tickers)} ticker(s) skipped due to insufficient data:")
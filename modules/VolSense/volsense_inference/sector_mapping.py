@@ -18,6 +18,7 @@ Helpers:
 Intended for analytics, dashboards, and reporting layers in volsense_inference.
 """
 import json
+from functools import lru_cache
 from pathlib import Path
 
 # ------------------------------------------------------------
@@ -792,10 +793,13 @@ def get_sector_map(version: str = "v109") -> dict[str, str]:
         raise ValueError(f"Unknown model version: {version}")
 
 
+@lru_cache(maxsize=8)
 def get_ticker_type_map(version: str = "v507") -> dict[str, str]:
     """
     Categorize each ticker into a high-level type (e.g. 'Equity', 'ETF', 'Crypto').
 
+    Memoized per version; the returned dict is shared and must not be mutated.
+
     :param version: Sector map version to use ('v109' or 'v507').
     :return: Dictionary mapping ticker → ticker_type
     """
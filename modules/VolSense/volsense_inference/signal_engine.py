@@ -15,8 +15,6 @@ Key changes vs. prior version:
 
 import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 from typing import Optional
 
 try:
@@ -142,6 +140,61 @@ def classify_position(row):
 
     return "NEUTRAL"
 
+def classify_positions(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized :func:`classify_position` over every row of a signals frame.
+
+    Rules are evaluated in the same order with the same thresholds; a NaN input
+    fails its comparison exactly as in the row-wise version.
+
+    :param df: Signals frame; missing feature columns are treated as 0.
+    :type df: pandas.DataFrame
+    :return: Position label per row.
+    :rtype: numpy.ndarray
+    """
+    def col(name):
+        if name in df.columns:
+            return df[name].to_numpy(dtype="float64")
+        return np.zeros(len(df))
+
+    z = col("vol_zscore")
+    term_spread = col("term_spread_10v5")
+    m5 = col("momentum_5d")
+    m20 = col("momentum_20d")
+
+    with np.errstate(invalid="ignore"):
+        conditions = [
+            (z > 1.5) & (term_spread < -0.02) & (m20 < -0.05),
+            (z > 1.0) & (term_spread > 0) & (m5 > 0.03) & (m20 > 0),
+            (z > 2.0) & (np.abs(m5) < 0.02),
+            (z > 0.5) & (z < 1.5) & (m5 < -0.02) & (m20 > 0.02),
+            (z < -0.5) & (m20 > 0.01),
+            (m5 > 0.02) & (m20 < -0.05),
+            z < -1.5,
+        ]
+    choices = [
+        "DEFENSIVE",
+        "LONG_VOL_TREND",
+        "SHORT_VOL",
+        "BUY_DIP",
+        "LONG_EQUITY",
+        "FADE_RALLY",
+        "LONG_TAIL_HEDGE",
+    ]
+    return np.select(conditions, choices, default="NEUTRAL").astype(object)
+
+
+ACTION_RECOMMENDATIONS = {
+    "DEFENSIVE": "Cash / Buy Puts",
+    "LONG_VOL_TREND": "Long Straddle / Gamma",
+    "SHORT_VOL": "Sell Iron Condor",
+    "BUY_DIP": "Buy Calls / Bull Spread", # <--- NEW
+    "LONG_EQUITY": "Long Stock",
+    "FADE_RALLY": "Short Stock / Bear Spread", # <--- NEW
+    "LONG_TAIL_HEDGE": "Buy Cheap Protection",
+    "NEUTRAL": "Wait"
+}
+
+
 def get_action_recommendation(signal: str) -> str:
     """Translate a regime label into an executable trading action.
 
@@ -150,17 +203,7 @@ def get_action_recommendation(signal: str) -> str:
     :return: Textual recommendation outlining the preferred trading structure.
     :rtype: str
     """
-    mapping = {
-        "DEFENSIVE": "Cash / Buy Puts",
-        "LONG_VOL_TREND": "Long Straddle / Gamma",
-        "SHORT_VOL": "Sell Iron Condor",
-        "BUY_DIP": "Buy Calls / Bull Spread", # <--- NEW
-        "LONG_EQUITY": "Long Stock",
-        "FADE_RALLY": "Short Stock / Bear Spread", # <--- NEW
-        "LONG_TAIL_HEDGE": "Buy Cheap Protection",
-        "NEUTRAL": "Wait"
-    }
-    return mapping.get(signal, "Wait")
+    return ACTION_RECOMMENDATIONS.get(signal, "Wait")
 
 # ============================================================
 # ⚙️ SignalEngine: Cross-Sectional and Sector Intelligence
@@ -355,18 +398,16 @@ class SignalEngine:
             df["vol_spread"] = np.nan
 
         # --- 2b. Inter-horizon (term-structure) spreads, e.g., 10d vs 5d
-        # Compute per ticker
-        term_spreads = []
-        for ticker, dsub in df.groupby("ticker"):
-            if set([5, 10]).issubset(dsub["horizon"].unique()):
-                vol_5 = dsub.loc[dsub["horizon"] == 5, "forecast_vol"].values[0]
-                vol_10 = dsub.loc[dsub["horizon"] == 10, "forecast_vol"].values[0]
-                spread_10v5 = (vol_10 / (vol_5 + 1e-8)) - 1
-                term_spreads.append((ticker, spread_10v5))
-            else:
-                term_spreads.append((ticker, np.nan))
-
-        term_df = pd.DataFrame(term_spreads, columns=["ticker", "term_spread_10v5"])
+        # One pivot of each ticker's first forecast per horizon; NaN if either is missing
+        fv = df.drop_duplicates(["ticker", "horizon"]).pivot(
+            index="ticker", columns="horizon", values="forecast_vol"
+        )
+        if 5 in fv.columns and 10 in fv.columns:
+            spread_10v5 = (fv[10] / (fv[5] + 1e-8)) - 1
+        else:
+            spread_10v5 = pd.Series(np.nan, index=fv.index)
+
+        term_df = spread_10v5.rename("term_spread_10v5").rename_axis("ticker").reset_index()
         df = df.merge(term_df, on="ticker", how="left")
 
         # --- 3. Cross-sectional ranks (strength & direction)
@@ -385,12 +426,11 @@ class SignalEngine:
             df = self._attach_sector(df)
             df = self._sector_rollups(df)
 
-        # --- 6. Position Classification
-        df["position"] = df.apply(classify_position, axis=1)
+        # --- 6. Position Classification (vectorized; same rules as classify_position)
+        df["position"] = classify_positions(df)
 
         # --- 7. New Signals ---
-        df["position"] = df.apply(classify_position, axis=1)
-        df["action"] = df["position"].apply(get_action_recommendation)
+        df["action"] = df["position"].map(ACTION_RECOMMENDATIONS).fillna("Wait")
 
         self.signals = df
         return df
@@ -477,6 +517,9 @@ class SignalEngine:
         :rtype: None
         :raises RuntimeError: If compute_signals() has not been called.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         if self.signals is None:
             raise RuntimeError("Run .compute_signals() first.")
         df = self.signals.copy()
@@ -521,6 +564,8 @@ class SignalEngine:
         :rtype: None
         :raises RuntimeError: If compute_signals() has not been called.
         """
+        import matplotlib.pyplot as plt
+
         if self.signals is None:
             raise RuntimeError("Run .compute_signals() first.")
         df = self.signals.copy()
@@ -583,6 +628,9 @@ class SignalEngine:
         :rtype: None
         :raises RuntimeError: If compute_signals() has not been called.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         if self.signals is None:
             raise RuntimeError("Run .compute_signals() first.")
 
@@ -623,6 +671,9 @@ class SignalEngine:
         :rtype: None
         :raises RuntimeError: If compute_signals() has not been called.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         if self.signals is None:
             raise RuntimeError("Run .compute_signals() first.")
 
@@ -0,0 +1,38 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from volsense_inference.signal_engine import classify_position, classify_positions
+
+# Every threshold in the rules, each side of it, the value itself and NaN
+Z = [np.nan, -1.6, -1.5, -1.4, -0.5, -0.4, 0.5, 0.6, 1.0, 1.1, 1.5, 1.6, 2.0, 2.1]
+TERM = [np.nan, -0.03, -0.02, -0.01, 0.0, 0.01]
+M5 = [np.nan, -0.03, -0.02, -0.019, 0.0, 0.019, 0.02, 0.021, 0.03, 0.031]
+M20 = [np.nan, -0.06, -0.05, -0.04, 0.0, 0.005, 0.01, 0.011, 0.02, 0.021]
+
+
+def _row_wise(df):
+    return df.apply(classify_position, axis=1).to_numpy(dtype=object)
+
+
+def test_matches_row_wise_on_boundary_grid():
+    df = pd.DataFrame(
+        list(itertools.product(Z, TERM, M5, M20)),
+        columns=["vol_zscore", "term_spread_10v5", "momentum_5d", "momentum_20d"],
+    )
+    expected = _row_wise(df)
+    got = classify_positions(df)
+
+    mismatch = np.flatnonzero(got != expected)
+    assert mismatch.size == 0, df.iloc[mismatch[:5]].assign(old=expected[mismatch[:5]], new=got[mismatch[:5]])
+    # The grid reaches every branch, so the comparison is not vacuous
+    assert set(expected) == {
+        "DEFENSIVE", "LONG_VOL_TREND", "SHORT_VOL", "BUY_DIP",
+        "LONG_EQUITY", "FADE_RALLY", "LONG_TAIL_HEDGE", "NEUTRAL",
+    }
+
+
+def test_missing_columns_default_to_zero():
+    df = pd.DataFrame({"vol_zscore": Z})
+    assert list(classify_positions(df)) == list(_row_wise(df))
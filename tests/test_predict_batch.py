@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import torch
+
+from volsense_inference.predictor import predict_batch
+
+META = {"window": 5, "horizons": [1, 5], "features": ["return", "f2"]}
+TICKERS = [f"T{i}" for i in range(7)]
+TICKER_TO_ID = {t: i + 1 for i, t in enumerate(TICKERS)}
+
+
+class ToyModel(torch.nn.Module):
+    """Row-independent output per horizon; raises for any batch containing `bad_id`."""
+
+    def __init__(self, bad_id=None):
+        super().__init__()
+        self.bad_id = bad_id
+
+    def forward(self, tid, X):
+        if self.bad_id is not None and bool((tid == self.bad_id).any()):
+            raise ValueError("bad ticker in batch")
+        return X.mean(dim=1) + 0.1 * tid[:, None].float()
+
+
+def _features():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2024-01-01", periods=10)
+    frames = [
+        pd.DataFrame({"date": dates, "ticker": t, "return": rng.normal(size=10), "f2": rng.normal(size=10)})
+        for t in TICKERS
+    ]
+    # Too short for the window: skipped when its tile's windows are built
+    frames.append(pd.DataFrame({"date": dates[:2], "ticker": "SHORT", "return": 0.0, "f2": 0.0}))
+    # Shuffled so the sort inside predict_batch is exercised
+    return pd.concat(frames).sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+
+def _run(model, batch_size):
+    out = predict_batch(
+        model, META, _features(), TICKERS + ["SHORT"],
+        ticker_to_id=TICKER_TO_ID, batch_size=batch_size,
+    )
+    return out.sort_values("ticker").reset_index(drop=True)
+
+
+def test_tiled_matches_untiled_with_ragged_last_tile():
+    # 8 tickers in tiles of 3 -> 3, 3, 2
+    tiled = _run(ToyModel(), batch_size=3)
+    untiled = _run(ToyModel(), batch_size=64)
+
+    pd.testing.assert_frame_equal(tiled, untiled)
+    assert tiled["ticker"].tolist() == TICKERS
+
+
+def test_bad_ticker_falls_back_without_dropping_its_tile():
+    # T4 shares the second tile with T3 and T5; that tile's batched pass fails
+    bad = TICKER_TO_ID["T4"]
+    tiled = _run(ToyModel(bad_id=bad), batch_size=3)
+    clean = _run(ToyModel(), batch_size=3)
+
+    assert tiled["ticker"].tolist() == [t for t in TICKERS if t != "T4"]
+    pd.testing.assert_frame_equal(
+        tiled, clean[clean["ticker"] != "T4"].reset_index(drop=True)
+    )
@@ -0,0 +1,73 @@
+import json
+from collections import defaultdict
+from types import SimpleNamespace
+
+from alphacouncil.tools import vol_tools
+
+
+def _old_sector_trends(cache):
+    """The defaultdict loop get_sector_trends replaced (minus the hydration path)."""
+    sector_stats = defaultdict(list)
+    signal_counts = defaultdict(lambda: defaultdict(int))
+
+    for payload in cache._cache.values():
+        sector = payload.get("sector", "Unknown")
+        signal_block = payload.get("signal", {}) or {}
+        strength = signal_block.get("strength")
+        position = (signal_block.get("position") or "NEUTRAL").upper()
+
+        if strength is not None:
+            try:
+                sector_stats[sector].append(float(strength))
+            except (TypeError, ValueError):
+                pass
+
+        signal_counts[sector][position] += 1
+
+    summary = []
+    for sector, strengths in sector_stats.items():
+        avg_strength = sum(strengths) / len(strengths) if strengths else 0.0
+        counts = signal_counts.get(sector, {})
+        summary.append(
+            {
+                "sector": sector,
+                "avg_signal_strength": round(avg_strength, 4),
+                "positions": counts,
+                "observation_count": sum(counts.values()),
+            }
+        )
+
+    summary.sort(key=lambda item: item["avg_signal_strength"], reverse=True)
+    return json.dumps({"sectors": summary})
+
+
+PAYLOADS = {
+    # Tech and Energy tie at 0.5; Energy is seen first only through a strength-less row
+    "E0": {"sector": "Energy", "signal": {"position": "short"}},
+    "T1": {"sector": "Tech", "signal": {"position": "long", "strength": 0.5}},
+    "T2": {"sector": "Tech", "signal": {"position": "LONG", "strength": "0.5"}},
+    "E1": {"sector": "Energy", "signal": {"position": "short", "strength": 0.5}},
+    "N1": {"sector": None, "signal": {"position": "long", "strength": 0.75}},
+    "N2": {"sector": None, "signal": None},
+    "U1": {"signal": {"strength": 0.25}},
+    "U2": {"sector": "Unknown", "signal": {"position": None, "strength": "n/a"}},
+    "H1": {"sector": "Health", "signal": {"position": "neutral"}},
+    # Listed at 0.0: the old loop created the bucket before the float() failed
+    "B1": {"sector": "Bonds", "signal": {"position": "long", "strength": "n/a"}},
+    "F1": {"sector": "Finance", "signal": {"position": "long", "strength": 0.125}},
+    "F2": {"sector": "Finance", "signal": {"position": "short", "strength": 0.375}},
+    "F3": {"sector": "Finance", "signal": {"position": "long", "strength": 0.25}},
+}
+
+
+def test_matches_old_loop(monkeypatch):
+    fake = SimpleNamespace(_cache=PAYLOADS)
+    monkeypatch.setattr(vol_tools, "get_daily_cache", lambda: fake)
+
+    new = json.loads(vol_tools.get_sector_trends.invoke({}))
+    old = json.loads(_old_sector_trends(fake))
+
+    assert new == old
+    sectors = [row["sector"] for row in new["sectors"]]
+    assert sectors == [None, "Tech", "Energy", "Unknown", "Finance", "Bonds"]
+    assert "Health" not in sectors
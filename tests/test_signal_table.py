@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from alphacouncil.tools.vol_tools import VolSenseService
+
+
+def _old_zscores(signals, ticker):
+    """The per-ticker loop _signal_table replaced: first row per horizon, 0.0 when absent."""
+    row_slice = signals[signals["ticker"] == ticker]
+    z_scores_by_horizon = {}
+    for h in [1, 5, 10]:
+        h_row = row_slice[row_slice["horizon"] == h]
+        if not h_row.empty:
+            z_scores_by_horizon[h] = round(float(h_row.iloc[0].get("vol_zscore", 0)), 2)
+        else:
+            z_scores_by_horizon[h] = 0.0
+    return z_scores_by_horizon
+
+
+def _same(a, b):
+    return (math.isnan(a) and math.isnan(b)) or a == b
+
+
+def _assert_matches_old_loop(signals):
+    preds = pd.DataFrame({"ticker": signals["ticker"].unique()})
+    table = VolSenseService._signal_table(signals, preds)
+    for ticker in signals["ticker"].unique():
+        old = _old_zscores(signals, ticker)
+        new = table.loc[ticker]
+        for h in (1, 5, 10):
+            assert _same(float(new[f"z_score_{h}d"]), old[h]), (ticker, h, new[f"z_score_{h}d"], old[h])
+
+
+def test_nan_zscore_and_horizon_missing_for_one_ticker():
+    signals = pd.DataFrame(
+        {
+            "ticker": ["AAA", "AAA", "AAA", "AAA", "BBB", "BBB"],
+            "horizon": [1, 5, 10, 1, 1, 5],
+            # AAA h=5 is NaN; AAA's second h=1 row must lose to its first; BBB has no h=10
+            "vol_zscore": [1.234, np.nan, -0.456, 9.0, 2.005, -1.111],
+        }
+    )
+    _assert_matches_old_loop(signals)
+
+    table = VolSenseService._signal_table(signals, pd.DataFrame({"ticker": ["AAA", "BBB"]}))
+    assert math.isnan(table.loc["AAA", "z_score_5d"])
+    assert table.loc["BBB", "z_score_10d"] == 0.0
+
+
+def test_horizon_missing_for_all_tickers():
+    signals = pd.DataFrame(
+        {
+            "ticker": ["AAA", "AAA", "BBB", "CCC"],
+            "horizon": [1, 5, 5, 1],
+            "vol_zscore": [0.5, np.nan, -0.75, 3.333],
+        }
+    )
+    _assert_matches_old_loop(signals)
+
+    table = VolSenseService._signal_table(signals, pd.DataFrame({"ticker": ["AAA", "BBB", "CCC"]}))
+    assert (table["z_score_10d"] == 0.0).all()